@@ -13,6 +13,7 @@ Features:
 - Robust error handling and fallback
 """
 
+import functools
 import logging
 import os
 import enum
@@ -35,6 +36,10 @@ from agent.security.error_handler import default_error_handler, safe_execution_d
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct queries whose detected intent is memoized per agent
+# when TEST_MEMOIZE=1
+INTENT_CACHE_SIZE = 256
+
 # For backward compatibility, maintain the original enums
 class ConversationState(enum.Enum):
     """Enum representing the state of the conversation flow."""
@@ -145,6 +150,16 @@ class DenialAssistantAgent:
             "closing": r'\b(bye|goodbye|thank|thanks)\b',
         }
         
+        # Intent detection is a pure function of the query text, so test runs
+        # (TEST_MEMOIZE=1) reuse earlier results for repeated queries. The
+        # cache keeps raw queries, which may contain PHI, so it is never
+        # enabled otherwise.
+        self._classify_intent_cached = None
+        if os.getenv("TEST_MEMOIZE") == "1":
+            self._classify_intent_cached = functools.lru_cache(maxsize=INTENT_CACHE_SIZE)(
+                self._classify_intent
+            )
+        
         logger.info(f"DenialAssistantAgent initialized with model: {self.model_name}, temperature: {self.temperature}")
     
     def _initialize_specialized_agents(self):
@@ -417,6 +432,27 @@ class DenialAssistantAgent:
         NOTE: This is maintained for backward compatibility. The workflow system
         now handles most routing based on context and state.
         
+        With TEST_MEMOIZE=1, results are memoized per query; cache statistics
+        are available from self._classify_intent_cached.cache_info().
+        
+        Args:
+            query: The user's query
+            
+        Returns:
+            Tuple containing the detected task type and any extracted information
+        """
+        if self._classify_intent_cached is None:
+            return self._classify_intent(query)
+        
+        task_type, extracted_info = self._classify_intent_cached(query)
+        
+        # Callers get their own copy so the cached entry is never modified
+        return task_type, dict(extracted_info)
+    
+    def _classify_intent(self, query: str) -> Tuple[TaskType, Dict[str, Any]]:
+        """
+        Classify a query's intent with the regex patterns (uncached).
+        
         Args:
             query: The user's query
             
@@ -13,6 +13,7 @@ Features:
 - Session timeout and recovery
 """
 
+import copy
 import logging
 import os
 import time
@@ -22,6 +23,9 @@ from typing import Any, Dict, List, Optional, Set, Union
 
 logger = logging.getLogger(__name__)
 
+# Number of session IDs generated from each batch of random bytes
+SESSION_ID_BATCH_SIZE = 64
+
 
 class SessionManager:
     """
@@ -52,6 +56,7 @@ class SessionManager:
         self.session_ttl = int(os.getenv("SESSION_TTL", 3600))  # Default: 1 hour
         self.max_history_length = int(os.getenv("MAX_HISTORY_LENGTH", 10))  # Default: 10 turns
         self.sessions = {}  # In-memory storage for sessions
+        self._session_id_pool = []  # Pre-generated session IDs
         
         # Define standard session fields for proper schema validation
         self.standard_fields = {
@@ -63,6 +68,26 @@ class SessionManager:
         
         logger.info(f"SessionManager initialized with TTL: {self.session_ttl} seconds")
     
+    def _new_session_id(self) -> str:
+        """
+        Generate a new session ID (a random version 4 UUID string).
+        
+        IDs are generated in batches from a single os.urandom call, so most
+        calls just take a pre-generated ID from the pool.
+        
+        Returns:
+            str: The new session ID
+        """
+        try:
+            return self._session_id_pool.pop()
+        except IndexError:
+            random_bytes = os.urandom(16 * SESSION_ID_BATCH_SIZE)
+            self._session_id_pool = [
+                str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4))
+                for i in range(0, len(random_bytes), 16)
+            ]
+            return self._session_id_pool.pop()
+    
     def create_session(self, initial_context: Optional[Dict[str, Any]] = None) -> str:
         """
         Create a new session for a conversation.
@@ -73,12 +98,13 @@ class SessionManager:
         Returns:
             str: The ID of the newly created session
         """
-        session_id = str(uuid.uuid4())
+        session_id = self._new_session_id()
+        now = time.time()
         
         # Initialize session with empty context
         session_context = {
-            "created_at": time.time(),
-            "last_active": time.time(),
+            "created_at": now,
+            "last_active": now,
             "conversation_history": [],
             "claim_details": {},
             "denial_codes": [],
@@ -472,6 +498,41 @@ class SessionManager:
             logger.error(f"Error importing session: {e}")
             return None
     
+    def clone_session(self, session_id: str) -> Optional[str]:
+        """
+        Copy a session under a new session ID.
+        
+        This is the in-process counterpart of export_session/import_session:
+        the session is deep-copied directly instead of round-tripping
+        through JSON.
+        
+        Args:
+            session_id: The ID of the session to copy
+            
+        Returns:
+            Optional[str]: The ID of the new session or None if error
+        """
+        try:
+            session = self.get_session(session_id)
+            
+            if not session:
+                logger.warning(f"Attempted to clone nonexistent session: {session_id}")
+                return None
+            
+            new_session_id = self._new_session_id()
+            
+            # Copy the session so later updates to either one stay separate
+            cloned_session = copy.deepcopy(session)
+            cloned_session["last_active"] = time.time()
+            self.sessions[new_session_id] = cloned_session
+            
+            logger.info(f"Cloned session {session_id} to {new_session_id}")
+            return new_session_id
+            
+        except Exception as e:
+            logger.error(f"Error cloning session {session_id}: {e}")
+            return None
+    
     def cleanup_expired_sessions(self) -> int:
         """
         Remove all expired sessions.
@@ -89,6 +89,7 @@ class PHIDetector:
             if "regex" in pattern_info and isinstance(pattern_info["regex"], str):
                 try:
                     pattern_info["compiled_regex"] = re.compile(pattern_info["regex"], re.IGNORECASE)
+                    pattern_info["compiled_context_boost"] = self._compile_context_boost(pattern_info)
                 except re.error as e:
                     logger.error(f"Error compiling regex pattern '{name}': {e}")
     
@@ -188,6 +189,22 @@ class PHIDetector:
             }
         }
     
+    @staticmethod
+    def _compile_context_boost(pattern_info: Dict[str, Any]) -> List[re.Pattern]:
+        """
+        Compile a pattern's context boost terms.
+        
+        Args:
+            pattern_info: Pattern information
+            
+        Returns:
+            List of compiled context boost regexes
+        """
+        return [
+            re.compile(boost_pattern, re.IGNORECASE)
+            for boost_pattern in pattern_info.get("context_boost", [])
+        ]
+    
     def _check_context_boost(self, text: str, pattern_info: Dict[str, Any], 
                            match_start: int, match_end: int) -> float:
         """
@@ -210,10 +227,15 @@ class PHIDetector:
         context_end = min(len(text), match_end + 50)
         context = text[context_start:context_end].lower()
         
-        # Check for boosting terms
+        # Check for boosting terms; patterns added to phi_patterns directly
+        # have no compiled terms yet, so compile them on first use
+        boost_regexes = pattern_info.get("compiled_context_boost")
+        if boost_regexes is None:
+            boost_regexes = pattern_info["compiled_context_boost"] = self._compile_context_boost(pattern_info)
+        
         boost = 0.0
-        for boost_pattern in pattern_info["context_boost"]:
-            if re.search(boost_pattern, context, re.IGNORECASE):
+        for boost_regex in boost_regexes:
+            if boost_regex.search(context):
                 boost += 0.1  # Add 0.1 for each context match
                 
         return min(boost, 0.3)  # Cap the boost at 0.3
@@ -397,9 +419,10 @@ class PHIDetector:
         if "confidence" not in pattern_info:
             pattern_info["confidence"] = 0.5
             
-        # Compile the regex
+        # Compile the regex and its context boost terms
         try:
             pattern_info["compiled_regex"] = re.compile(pattern_info["regex"], re.IGNORECASE)
+            pattern_info["compiled_context_boost"] = self._compile_context_boost(pattern_info)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
             
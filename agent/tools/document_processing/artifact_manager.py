@@ -108,7 +108,7 @@ class ArtifactManager:
             logger.error(f"Error saving artifact metadata: {e}")
     
     def store_artifact(self, 
-                      document_data: Union[bytes, str], 
+                      document_data: Union[bytes, bytearray, memoryview, str], 
                       filename: str,
                       content_type: str,
                       session_id: Optional[str] = None,
@@ -116,6 +116,9 @@ class ArtifactManager:
         """
         Store a document artifact securely.
         
+        Binary data may be any buffer (bytes, memoryview, mmap, ...); it is
+        written to disk without being copied into a new bytes object first.
+        
         Args:
             document_data: The document data (either binary or Base64 encoded)
             filename: Original filename
@@ -137,8 +140,8 @@ class ArtifactManager:
                 logger.error(f"Failed to decode Base64 string: {e}")
                 raise ValueError("Invalid document data: not a valid Base64 string")
         
-        # Check size limits
-        size_bytes = len(document_data)
+        # Check size limits (nbytes, since len() of a memoryview counts items)
+        size_bytes = memoryview(document_data).nbytes
         if size_bytes > (MAX_ARTIFACT_SIZE_MB * 1024 * 1024):
             raise ValueError(f"Document exceeds maximum size of {MAX_ARTIFACT_SIZE_MB}MB")
         
@@ -230,6 +233,32 @@ class ArtifactManager:
         
         return True
     
+    def delete_artifacts(self, artifact_ids: List[str]) -> int:
+        """
+        Delete several artifacts, rewriting the metadata file only once.
+        
+        Args:
+            artifact_ids: The IDs of the artifacts to delete
+            
+        Returns:
+            Number of artifacts deleted (unknown IDs are skipped)
+        """
+        deleted = 0
+        for artifact_id in artifact_ids:
+            if self.artifacts_metadata.pop(artifact_id, None) is None:
+                continue
+            
+            # Delete the file
+            artifact_path = os.path.join(self.artifact_dir, artifact_id)
+            if os.path.exists(artifact_path):
+                os.remove(artifact_path)
+            deleted += 1
+        
+        if deleted:
+            self._save_metadata()
+        
+        return deleted
+    
     def get_artifacts_by_session(self, session_id: str) -> List[Dict]:
         """
         Get all artifacts associated with a session.
@@ -258,10 +287,7 @@ class ArtifactManager:
             if metadata.get("expiration_time", now) < now
         ]
         
-        for artifact_id in expired_artifacts:
-            self.delete_artifact(artifact_id)
-        
-        return len(expired_artifacts)
+        return self.delete_artifacts(expired_artifacts)
     
     def update_session_id(self, artifact_id: str, session_id: str) -> bool:
         """
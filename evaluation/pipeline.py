@@ -2,11 +2,12 @@
 
 import os
 import json
+import asyncio
 import time
 import datetime
 import uuid
 import logging
-from typing import Dict, List, Any, Optional, Callable, Union, Tuple
+from typing import Dict, List, Any, Optional, Callable, Union, Tuple, Iterator
 import concurrent.futures
 from functools import partial
 
@@ -91,6 +92,45 @@ class TestScenario:
             metadata=data.get("metadata", {})
         )
     
+    @classmethod
+    def load_dir(cls, scenarios_dir: str) -> List['TestScenario']:
+        """Load all test scenarios from the JSON files under a directory.
+        
+        Each file may hold a single scenario or a list of scenarios. Files
+        that fail to load are logged and skipped.
+        
+        Args:
+            scenarios_dir: Directory containing test scenarios
+            
+        Returns:
+            List of TestScenario instances
+        """
+        scenarios = []
+        
+        # Find scenario files
+        scenario_files = []
+        for root, _, files in os.walk(scenarios_dir):
+            for file in files:
+                if file.endswith(".json"):
+                    scenario_files.append(os.path.join(root, file))
+        
+        # Load scenarios from files
+        for file_path in scenario_files:
+            try:
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
+                    
+                # Handle single scenario or list of scenarios
+                if isinstance(data, list):
+                    scenarios.extend(cls.from_dict(scenario_data) for scenario_data in data)
+                else:
+                    scenarios.append(cls.from_dict(data))
+                    
+            except Exception as e:
+                logger.error(f"Error loading scenario from {file_path}: {e}")
+        
+        return scenarios
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the test scenario to a dictionary.
         
@@ -501,7 +541,8 @@ class EvaluationPipeline:
         scenarios_dir: str = "evaluation/benchmark_data",
         results_dir: str = "evaluation/results",
         metrics_to_evaluate: Optional[List[EvaluationMetric]] = None,
-        parallel_execution: bool = True
+        parallel_execution: bool = True,
+        scenarios: Optional[List[TestScenario]] = None
     ):
         """Initialize the evaluation pipeline.
         
@@ -510,6 +551,8 @@ class EvaluationPipeline:
             results_dir: Directory to save evaluation results
             metrics_to_evaluate: List of metrics to evaluate
             parallel_execution: Whether to run scenarios in parallel
+            scenarios: Optional pre-loaded scenarios; when given, scenarios_dir
+                is not scanned
         """
         self.scenarios_dir = scenarios_dir
         self.results_dir = results_dir
@@ -524,7 +567,10 @@ class EvaluationPipeline:
         self.evaluator = AutomaticEvaluator(metrics_to_evaluate)
         
         # Load scenarios
-        self.scenarios = self._load_scenarios()
+        if scenarios is not None:
+            self.scenarios = {scenario.scenario_id: scenario for scenario in scenarios}
+        else:
+            self.scenarios = self._load_scenarios()
     
     def _load_scenarios(self) -> Dict[str, TestScenario]:
         """Load test scenarios from files.
@@ -532,32 +578,10 @@ class EvaluationPipeline:
         Returns:
             Dictionary mapping scenario IDs to TestScenario objects
         """
-        scenarios = {}
-        
-        # Find scenario files
-        scenario_files = []
-        for root, _, files in os.walk(self.scenarios_dir):
-            for file in files:
-                if file.endswith(".json"):
-                    scenario_files.append(os.path.join(root, file))
-        
-        # Load scenarios from files
-        for file_path in scenario_files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                # Handle single scenario or list of scenarios
-                if isinstance(data, list):
-                    for scenario_data in data:
-                        scenario = TestScenario.from_dict(scenario_data)
-                        scenarios[scenario.scenario_id] = scenario
-                else:
-                    scenario = TestScenario.from_dict(data)
-                    scenarios[scenario.scenario_id] = scenario
-                    
-            except Exception as e:
-                logger.error(f"Error loading scenario from {file_path}: {e}")
+        scenarios = {
+            scenario.scenario_id: scenario
+            for scenario in TestScenario.load_dir(self.scenarios_dir)
+        }
         
         logger.info(f"Loaded {len(scenarios)} test scenarios")
         return scenarios
@@ -614,18 +638,68 @@ class EvaluationPipeline:
                         logger.error(f"Error in scenario {scenario_id}: {e}")
         else:
             # Run scenarios sequentially
-            for scenario_id, scenario in self.scenarios.items():
+            results.update(self.evaluate_iter())
+        
+        # Generate summary report
+        self._generate_summary_report(results)
+        
+        return results
+    
+    async def evaluate_all_async(self, max_concurrent_scenarios: int = 8) -> Dict[str, EvaluationResult]:
+        """Evaluate all loaded test scenarios concurrently from an event loop.
+        
+        Each scenario runs in a worker thread while a semaphore bounds how
+        many are in flight, so slow agent calls overlap without flooding
+        the model backend. Scenarios that fail are logged and skipped.
+        
+        Args:
+            max_concurrent_scenarios: Maximum number of scenarios evaluated at once
+            
+        Returns:
+            Dictionary mapping scenario IDs to evaluation results
+        """
+        semaphore = asyncio.Semaphore(max_concurrent_scenarios)
+        
+        async def run(scenario_id: str, scenario: TestScenario) -> Optional[EvaluationResult]:
+            async with semaphore:
                 try:
-                    result = self.evaluate_scenario(scenario)
-                    results[scenario_id] = result
+                    return await asyncio.to_thread(self.evaluate_scenario, scenario)
                 except Exception as e:
                     logger.error(f"Error in scenario {scenario_id}: {e}")
+                    return None
+        
+        scenario_ids = list(self.scenarios)
+        outcomes = await asyncio.gather(
+            *(run(scenario_id, self.scenarios[scenario_id]) for scenario_id in scenario_ids)
+        )
+        results = {
+            scenario_id: result
+            for scenario_id, result in zip(scenario_ids, outcomes)
+            if result is not None
+        }
         
         # Generate summary report
         self._generate_summary_report(results)
         
         return results
     
+    def evaluate_iter(self) -> Iterator[Tuple[str, EvaluationResult]]:
+        """Evaluate loaded test scenarios one at a time.
+        
+        Scenarios that fail are logged and skipped. Unlike evaluate_all, no
+        summary report is generated, so callers can stop early.
+        
+        Yields:
+            Tuples of (scenario_id, evaluation result)
+        """
+        for scenario_id, scenario in self.scenarios.items():
+            try:
+                result = self.evaluate_scenario(scenario)
+            except Exception as e:
+                logger.error(f"Error in scenario {scenario_id}: {e}")
+                continue
+            yield scenario_id, result
+    
     def _save_result(self, result: EvaluationResult):
         """Save an evaluation result to a file.
         
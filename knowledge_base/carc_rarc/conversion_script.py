@@ -10,10 +10,23 @@ import re
 import json
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define the path to the CARC-RARC markdown file
 MARKDOWN_FILE = "../../Project Documentation/CARC-RARC-Codes.md"
 OUTPUT_FILE = "carc_rarc_knowledge.json"
 
+# Compiled patterns
+CARC_ROW_PATTERN = re.compile(r'\|\s*\*\*(\d+|[A-Z]\d+)\*\*\s*\|\s*\*\*([^|]+)\*\*\s*\|\s*([^|]*)\s*\|')
+GROUP_CODES_SECTION_PATTERN = re.compile(r'## Adjustment Group Codes \(Category Codes\)(.*?)##', re.DOTALL)
+GROUP_CODE_PATTERN = re.compile(r'\*\*(CO|PR|OA|PI|CR)\s*–\s*([^:]+):\*\*\s*([^(]*)(\([^)]*\))?')
+RARC_SECTION_PATTERN = re.compile(r'## Remittance Advice Remark Codes \(RARCs\)(.*?)##', re.DOTALL)
+RARC_ENTRY_PATTERN = re.compile(r'\*\*(MA\d+|MB\d+|N\d+|M\d+)\*\*\s*(?:–|-)?\s*(?:\*\*)?([^*]+)(?:\*\*)?')
+RARC_MENTION_PATTERN = re.compile(r'(MA\d+|MB\d+|N\d+|M\d+)')
+
 def extract_carc_codes(content: str) -> List[Dict[str, Any]]:
     """
     Extract CARC codes from the markdown content.
@@ -24,9 +37,8 @@ def extract_carc_codes(content: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries containing CARC code information
     """
-    # Regular expression to match CARC code table rows
-    pattern = r'\|\s*\*\*(\d+|[A-Z]\d+)\*\*\s*\|\s*\*\*([^|]+)\*\*\s*\|\s*([^|]*)\s*\|'
-    matches = re.findall(pattern, content)
+    # Match CARC code table rows
+    matches = CARC_ROW_PATTERN.findall(content)
     
     carc_codes = []
     for match in matches:
@@ -60,7 +72,7 @@ def extract_group_codes(content: str) -> List[Dict[str, Any]]:
         List of dictionaries containing Group Code information
     """
     # Extract the Group Codes section
-    group_codes_section = re.search(r'## Adjustment Group Codes \(Category Codes\)(.*?)##', content, re.DOTALL)
+    group_codes_section = GROUP_CODES_SECTION_PATTERN.search(content)
     
     if not group_codes_section:
         return []
@@ -68,8 +80,7 @@ def extract_group_codes(content: str) -> List[Dict[str, Any]]:
     group_codes_content = group_codes_section.group(1)
     
     # Extract the group codes and descriptions
-    pattern = r'\*\*(CO|PR|OA|PI|CR)\s*–\s*([^:]+):\*\*\s*([^(]*)(\([^)]*\))?'
-    matches = re.findall(pattern, group_codes_content)
+    matches = GROUP_CODE_PATTERN.findall(group_codes_content)
     
     group_codes = []
     for match in matches:
@@ -101,7 +112,7 @@ def extract_rarc_codes(content: str) -> List[Dict[str, Any]]:
         List of dictionaries containing RARC code information
     """
     # Extract RARC section
-    rarc_section = re.search(r'## Remittance Advice Remark Codes \(RARCs\)(.*?)##', content, re.DOTALL)
+    rarc_section = RARC_SECTION_PATTERN.search(content)
     
     if not rarc_section:
         return []
@@ -109,8 +120,7 @@ def extract_rarc_codes(content: str) -> List[Dict[str, Any]]:
     rarc_content = rarc_section.group(1)
     
     # Extract RARC code patterns like MA01, N382, etc. mentioned in the text
-    pattern = r'\*\*(MA\d+|MB\d+|N\d+|M\d+)\*\*\s*(?:–|-)?\s*(?:\*\*)?([^*]+)(?:\*\*)?'
-    matches = re.findall(pattern, rarc_content)
+    matches = RARC_ENTRY_PATTERN.findall(rarc_content)
     
     rarc_codes = []
     for match in matches:
@@ -155,7 +165,7 @@ def link_carc_rarc_relationships(carc_codes: List[Dict[str, Any]], rarc_codes: L
             continue
         
         # Find all RARC codes mentioned in the notes
-        rarc_mentions = re.findall(r'(MA\d+|MB\d+|N\d+|M\d+)', notes)
+        rarc_mentions = RARC_MENTION_PATTERN.findall(notes)
         
         for rarc_code in rarc_mentions:
             if rarc_code in rarc_lookup:
@@ -356,9 +366,13 @@ def main():
         }
     }
     
-    # Save to JSON file
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as file:
-        json.dump(knowledge_base, file, indent=2)
+    # Save to JSON file (orjson serializes in C when available)
+    if orjson is not None:
+        with open(OUTPUT_FILE, 'wb') as file:
+            file.write(orjson.dumps(knowledge_base, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as file:
+            json.dump(knowledge_base, file, indent=2)
     
     print(f"Successfully extracted {len(carc_codes)} CARC codes, {len(rarc_codes)} RARC codes, and {len(group_codes)} Group Codes.")
     print(f"Knowledge base saved to {OUTPUT_FILE}")
@@ -8,85 +8,96 @@ and converts them into a structured JSON format for the knowledge base.
 import os
 import re
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Define the path to the Don't Bill Together markdown file
 MARKDOWN_FILE = "../../Project Documentation/Dont_Bill_Together.md"
 OUTPUT_FILE = "dont_bill_together_knowledge.json"
 
-def extract_code_pairs(content: str) -> Dict[str, List[Dict[str, Any]]]:
+# Compiled patterns
+CODE_PATTERN = re.compile(r'(\d{5}|\d{4}[A-Z]|[A-Z]\d{4})')
+CODE_SEPARATOR_PATTERN = re.compile(r'[\s–-]')
+
+# Section headers that open the two code pair tables
+NOT_ALLOWED_HEADER = "## Code Pairs with Modifier Indicator **0**"
+ALLOWED_HEADER = "## Code Pairs with Modifier Indicator **1**"
+
+def extract_code_pairs(lines: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
     """
     Extract code pairs that should not be billed together from the markdown content.
     
+    The markdown is scanned line by line: section headers switch the current
+    table, and each ``|``-delimited row inside a table becomes one code pair
+    with its resolution guidance, example scenario and documentation
+    requirements attached.
+    
     Args:
-        content: The markdown content
+        lines: The markdown content as an iterable of lines (e.g. an open file)
         
     Returns:
         Dictionary with two keys: "modifier_not_allowed" and "modifier_allowed",
         each containing a list of code pair dictionaries
     """
-    # Extract the two main sections
-    modifier_not_allowed_section = re.search(
-        r'## Code Pairs with Modifier Indicator \*\*0\*\* \(Modifier Not Allowed\)(.*?)## Code Pairs with Modifier Indicator',
-        content, 
-        re.DOTALL
-    )
-    
-    modifier_allowed_section = re.search(
-        r'## Code Pairs with Modifier Indicator \*\*1\*\* \(Modifier Allowed\)(.*?)---',
-        content,
-        re.DOTALL
-    )
-    
     result = {
         "modifier_not_allowed": [],
         "modifier_allowed": []
     }
     
-    # Process the modifier not allowed section
-    if modifier_not_allowed_section:
-        section_content = modifier_not_allowed_section.group(1)
-        table_rows = re.findall(r'\|\s*\*\*([^\*]+)\*\*[^|]*\|\s*\*\*([^\*]+)\*\*[^|]*\|\s*(\d)\s*\|\s*(\d+)\s*\|\s*([^|]*)\|', section_content)
+    mode = None
+    for line in lines:
+        stripped = line.strip()
         
-        for row in table_rows:
-            col1_code, col2_code, modifier_indicator, effective_date, deletion_date = row
-            
-            # Clean up and extract the base code without description
-            col1_code = extract_code(col1_code)
-            col2_code = extract_code(col2_code)
-            
-            # Create the entry
-            entry = {
-                "column1_code": col1_code,
-                "column2_code": col2_code,
-                "modifier_indicator": "0",  # Always 0 in this section
-                "effective_date": effective_date.strip(),
-                "deletion_date": deletion_date.strip() if deletion_date.strip() != "–" else None
-            }
-            
-            result["modifier_not_allowed"].append(entry)
-    
-    # Process the modifier allowed section
-    if modifier_allowed_section:
-        section_content = modifier_allowed_section.group(1)
-        table_rows = re.findall(r'\|\s*\*\*([^\*]+)\*\*[^|]*\|\s*\*\*([^\*]+)\*\*[^|]*\|\s*(\d)\s*\|\s*(\d+)\s*\|\s*([^|]*)\|', section_content)
+        # Track which table we are in based on section headers
+        if stripped.startswith("## "):
+            if stripped.startswith(NOT_ALLOWED_HEADER):
+                mode = "not_allowed"
+            elif stripped.startswith(ALLOWED_HEADER):
+                mode = "allowed"
+            else:
+                mode = None
+            continue
+        if stripped == "---":
+            mode = None
+            continue
         
-        for row in table_rows:
-            col1_code, col2_code, modifier_indicator, effective_date, deletion_date = row
-            
-            # Clean up and extract the base code without description
-            col1_code = extract_code(col1_code)
-            col2_code = extract_code(col2_code)
-            
-            # Create the entry
-            entry = {
-                "column1_code": col1_code,
-                "column2_code": col2_code,
-                "modifier_indicator": "1",  # Always 1 in this section
-                "effective_date": effective_date.strip(),
-                "deletion_date": deletion_date.strip() if deletion_date.strip() != "–" else None
-            }
-            
+        if mode is None or not stripped.startswith("|"):
+            continue
+        
+        cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+        if len(cells) < 5:
+            continue
+        
+        col1_code, col2_code, modifier_indicator, effective_date, deletion_date = cells[:5]
+        
+        # Skip header, separator and note rows
+        if not (modifier_indicator.isdigit() and effective_date.isdigit()):
+            continue
+        
+        # Clean up and extract the base code without description
+        col1_code = extract_code(col1_code.strip("*").strip())
+        col2_code = extract_code(col2_code.strip("*").strip())
+        
+        # Create the entry
+        entry = {
+            "column1_code": col1_code,
+            "column2_code": col2_code,
+            "modifier_indicator": "0" if mode == "not_allowed" else "1",
+            "effective_date": effective_date,
+            "deletion_date": deletion_date if deletion_date not in ("", "–") else None
+        }
+        
+        # Derive guidance and examples while the entry is being built
+        _attach_guidance(entry)
+        _attach_examples(entry)
+        
+        if mode == "not_allowed":
+            result["modifier_not_allowed"].append(entry)
+        else:
             result["modifier_allowed"].append(entry)
     
     return result
@@ -102,12 +113,12 @@ def extract_code(code_text: str) -> str:
         The code portion only
     """
     # Pattern to match a code at the beginning of the text
-    match = re.match(r'(\d{5}|\d{4}[A-Z]|[A-Z]\d{4})', code_text.strip())
+    match = CODE_PATTERN.match(code_text.strip())
     if match:
         return match.group(1)
     
     # If not found, try to get the whole string up to the first space or dash
-    parts = re.split(r'[\s–-]', code_text.strip(), 1)
+    parts = CODE_SEPARATOR_PATTERN.split(code_text.strip(), 1)
     return parts[0].strip()
 
 def extract_allowed_modifiers() -> List[str]:
@@ -125,104 +136,133 @@ def extract_allowed_modifiers() -> List[str]:
         "TC", "XE", "XP", "XS", "XU"
     ]
 
-def add_resolution_guidance(code_pairs: Dict[str, List[Dict[str, Any]]]) -> None:
+# Guidance and documentation text shared by every code pair of a kind.
+# Pairs reference these tuples instead of holding their own copies.
+NOT_ALLOWED_GUIDANCE_TAIL = (
+    "This is a hard edit in NCCI and cannot be bypassed with any modifier.",
+    "If both services were truly provided, you may only bill for the Column 1 code.",
+    "If both services were provided at separate encounters on the same day, consider using different dates of service if appropriate.",
+    "Check if an alternative code combination could accurately represent the services provided."
+)
+
+MODIFIER_ALLOWED_GUIDANCE_TAIL = (
+    "If the services were performed at different sites, different sessions, or for different conditions, you may append an appropriate modifier to the Column 2 code.",
+    "Appropriate modifiers include: 59 (Distinct procedural service), XE (Separate encounter), XS (Separate structure), XP (Separate practitioner), or XU (Unusual non-overlapping service).",
+    "Document thoroughly why the services are separate and distinct.",
+    "Ensure medical necessity for both services is clearly established in the documentation."
+)
+
+LAB_PANEL_DOCUMENTATION = (
+    "Document only the panel code when all components were performed.",
+    "If additional tests beyond the panel were performed, document their medical necessity separately."
+)
+
+SURGERY_DOCUMENTATION = (
+    "Operative report must clearly document each procedure performed.",
+    "For modifier-allowed pairs, document why procedures were distinct (different site, session, etc.).",
+    "Include anatomical details, separate incisions, or timing differences if applicable."
+)
+
+THERAPY_DOCUMENTATION = (
+    "Document start and end times for each therapy service.",
+    "For modifier-allowed pairs, clearly indicate different goals or treatment focus.",
+    "Include separate progress notes if services were provided at different times."
+)
+
+DEFAULT_DOCUMENTATION = (
+    "Clearly document medical necessity for each service.",
+    "If using modifiers (when allowed), document why services were separate and distinct.",
+    "Include relevant timing, anatomical sites, and separate documentation for each service."
+)
+
+# Example scenario template and documentation requirements per pair category
+PAIR_CATEGORY_DETAILS = {
+    "lab_panel": (
+        "Panel code {col1} includes the individual test {col2}. "
+        "Example: A lipid panel (80061) includes cholesterol (82465), so billing both would be duplicate billing.",
+        LAB_PANEL_DOCUMENTATION
+    ),
+    "surgery": (
+        "Surgical procedure {col1} typically includes {col2} as part of the same operative session. "
+        "Example: When a more comprehensive procedure includes a lesser one as a component.",
+        SURGERY_DOCUMENTATION
+    ),
+    "therapy": (
+        "Therapy codes {col1} and {col2} represent services that overlap or are mutually exclusive. "
+        "Example: Certain therapy modalities that cannot be reasonably provided during the same session.",
+        THERAPY_DOCUMENTATION
+    ),
+    "default": (
+        "Codes {col1} and {col2} represent services that are either components of each other "
+        "or mutually exclusive according to CPT coding guidelines and CMS policy.",
+        DEFAULT_DOCUMENTATION
+    )
+}
+
+def _is_surgery(code: str) -> bool:
+    """Check whether a code is a five-digit surgery code (10000-69999 series)."""
+    return len(code) == 5 and code.isdigit() and "1" <= code[0] <= "6"
+
+def _is_therapy(code: str) -> bool:
+    """Check whether a code is a five-digit therapy code (90000-99999 series)."""
+    return len(code) == 5 and code.isdigit() and code[0] == "9"
+
+def classify_code_pair(col1_code: str, col2_code: str) -> str:
     """
-    Add resolution guidance to each code pair based on its modifier indicator.
+    Classify a code pair into one of the PAIR_CATEGORY_DETAILS categories.
     
     Args:
-        code_pairs: Dictionary with modifier_not_allowed and modifier_allowed lists
+        col1_code: Column 1 code
+        col2_code: Column 2 code
+        
+    Returns:
+        Category name
     """
-    # Add guidance for modifier not allowed pairs
-    for pair in code_pairs["modifier_not_allowed"]:
-        pair["resolution_guidance"] = [
-            f"These codes ({pair['column1_code']} and {pair['column2_code']}) cannot be billed together under any circumstances.",
-            "This is a hard edit in NCCI and cannot be bypassed with any modifier.",
-            "If both services were truly provided, you may only bill for the Column 1 code.",
-            "If both services were provided at separate encounters on the same day, consider using different dates of service if appropriate.",
-            "Check if an alternative code combination could accurately represent the services provided."
-        ]
+    # Lab panel examples (80000 series)
+    if col1_code.startswith("80") and col2_code.startswith("8"):
+        return "lab_panel"
+    if _is_surgery(col1_code) and _is_surgery(col2_code):
+        return "surgery"
+    if _is_therapy(col1_code) and _is_therapy(col2_code):
+        return "therapy"
+    return "default"
+
+def _attach_guidance(pair: Dict[str, Any]) -> None:
+    """
+    Add resolution guidance to a code pair based on its modifier indicator.
     
-    # Add guidance for modifier allowed pairs
-    for pair in code_pairs["modifier_allowed"]:
-        pair["resolution_guidance"] = [
+    Args:
+        pair: Code pair dictionary
+    """
+    if pair["modifier_indicator"] == "0":
+        pair["resolution_guidance"] = (
+            f"These codes ({pair['column1_code']} and {pair['column2_code']}) cannot be billed together under any circumstances.",
+            *NOT_ALLOWED_GUIDANCE_TAIL
+        )
+    else:
+        pair["resolution_guidance"] = (
             f"These codes ({pair['column1_code']} and {pair['column2_code']}) cannot be billed together unless the services are distinct and separate.",
-            "If the services were performed at different sites, different sessions, or for different conditions, you may append an appropriate modifier to the Column 2 code.",
-            "Appropriate modifiers include: 59 (Distinct procedural service), XE (Separate encounter), XS (Separate structure), XP (Separate practitioner), or XU (Unusual non-overlapping service).",
-            "Document thoroughly why the services are separate and distinct.",
-            "Ensure medical necessity for both services is clearly established in the documentation."
-        ]
+            *MODIFIER_ALLOWED_GUIDANCE_TAIL
+        )
 
-def add_examples_and_documentation_requirements(code_pairs: Dict[str, List[Dict[str, Any]]]) -> None:
+def _attach_examples(pair: Dict[str, Any]) -> None:
     """
-    Add example scenarios and documentation requirements for code pairs.
+    Add an example scenario and documentation requirements to a code pair.
     
     Args:
-        code_pairs: Dictionary with modifier_not_allowed and modifier_allowed lists
+        pair: Code pair dictionary
     """
-    # Add general examples based on code patterns
-    for category in ["modifier_not_allowed", "modifier_allowed"]:
-        for pair in code_pairs[category]:
-            col1_code = pair["column1_code"]
-            col2_code = pair["column2_code"]
-            
-            # Lab panel examples (80000 series)
-            if col1_code.startswith("80") and col2_code.startswith("8"):
-                pair["example_scenario"] = (
-                    f"Panel code {col1_code} includes the individual test {col2_code}. "
-                    "Example: A lipid panel (80061) includes cholesterol (82465), so billing both would be duplicate billing."
-                )
-                pair["documentation_requirements"] = [
-                    "Document only the panel code when all components were performed.",
-                    "If additional tests beyond the panel were performed, document their medical necessity separately."
-                ]
-            
-            # Surgery examples (10000-69999 series)
-            elif re.match(r"^[1-6]\d{4}$", col1_code) and re.match(r"^[1-6]\d{4}$", col2_code):
-                pair["example_scenario"] = (
-                    f"Surgical procedure {col1_code} typically includes {col2_code} as part of the same operative session. "
-                    "Example: When a more comprehensive procedure includes a lesser one as a component."
-                )
-                pair["documentation_requirements"] = [
-                    "Operative report must clearly document each procedure performed.",
-                    "For modifier-allowed pairs, document why procedures were distinct (different site, session, etc.).",
-                    "Include anatomical details, separate incisions, or timing differences if applicable."
-                ]
-            
-            # Therapy examples (90000-99999 series)
-            elif re.match(r"^9\d{4}$", col1_code) and re.match(r"^9\d{4}$", col2_code):
-                pair["example_scenario"] = (
-                    f"Therapy codes {col1_code} and {col2_code} represent services that overlap or are mutually exclusive. "
-                    "Example: Certain therapy modalities that cannot be reasonably provided during the same session."
-                )
-                pair["documentation_requirements"] = [
-                    "Document start and end times for each therapy service.",
-                    "For modifier-allowed pairs, clearly indicate different goals or treatment focus.",
-                    "Include separate progress notes if services were provided at different times."
-                ]
-            
-            # Default example
-            else:
-                pair["example_scenario"] = (
-                    f"Codes {col1_code} and {col2_code} represent services that are either components of each other "
-                    "or mutually exclusive according to CPT coding guidelines and CMS policy."
-                )
-                pair["documentation_requirements"] = [
-                    "Clearly document medical necessity for each service.",
-                    "If using modifiers (when allowed), document why services were separate and distinct.",
-                    "Include relevant timing, anatomical sites, and separate documentation for each service."
-                ]
+    col1_code = pair["column1_code"]
+    col2_code = pair["column2_code"]
+    
+    example_template, documentation = PAIR_CATEGORY_DETAILS[classify_code_pair(col1_code, col2_code)]
+    pair["example_scenario"] = example_template.format(col1=col1_code, col2=col2_code)
+    pair["documentation_requirements"] = documentation
 
 def main():
-    # Read the markdown file
-    with open(MARKDOWN_FILE, 'r', encoding='utf-8') as file:
-        content = file.read()
-    
-    # Extract code pairs
-    code_pairs = extract_code_pairs(content)
-    
-    # Add guidance and examples
-    add_resolution_guidance(code_pairs)
-    add_examples_and_documentation_requirements(code_pairs)
+    # Extract code pairs, streaming the markdown file line by line
+    with open(MARKDOWN_FILE, 'r', encoding='utf-8', buffering=1 << 20) as file:
+        code_pairs = extract_code_pairs(file)
     
     # Get allowed modifiers
     allowed_modifiers = extract_allowed_modifiers()
@@ -238,9 +278,13 @@ def main():
         }
     }
     
-    # Save to JSON file
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as file:
-        json.dump(knowledge_base, file, indent=2)
+    # Save to JSON file (orjson serializes in C when available)
+    if orjson is not None:
+        with open(OUTPUT_FILE, 'wb') as file:
+            file.write(orjson.dumps(knowledge_base, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as file:
+            json.dump(knowledge_base, file, indent=2)
     
     not_allowed_count = len(code_pairs["modifier_not_allowed"])
     allowed_count = len(code_pairs["modifier_allowed"])
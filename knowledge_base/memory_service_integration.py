@@ -8,9 +8,90 @@ and provides a unified interface for the agent to access the knowledge.
 import os
 import json
 import time
-from typing import Dict, List, Any, Optional, Tuple
+import functools
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from google.adk.memory import VertexAIRagMemoryService
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_MISSING = object()
+
+# Knowledge base files at least this large are stream-parsed section by
+# section with ijson when available; smaller files are parsed once in full
+STREAMING_THRESHOLD_BYTES = 8 << 20
+
+
+class LazyKnowledgeBase(Mapping):
+    """
+    Read-only view of a knowledge base JSON file whose top-level sections
+    are parsed on first access.
+    
+    Used for files of at least STREAMING_THRESHOLD_BYTES, where streaming a
+    single section is cheaper than parsing the whole document. A requested
+    section is streamed from the file with ijson and parsing stops as soon as
+    that section has been read, so sections that are never queried are never
+    materialized. Without ijson, the whole file is loaded through the
+    fallback loader the first time any section is needed.
+    """
+    
+    def __init__(self, file_path: str, load_all: Callable[[str], Dict[str, Any]]):
+        """
+        Initialize the lazy knowledge base.
+        
+        Args:
+            file_path: Path to the knowledge base JSON file
+            load_all: Function that loads and returns the whole file
+        """
+        self.file_path = file_path
+        self._load_all = load_all
+        self._sections: Dict[str, Any] = {}
+        self._absent = set()
+        self._complete = False
+    
+    def _load_complete(self) -> None:
+        """Load every section of the knowledge base."""
+        if not self._complete:
+            self._sections = dict(self._load_all(self.file_path))
+            self._complete = True
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self._sections.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        if key in self._absent:
+            raise KeyError(key)
+        
+        if self._complete or ijson is None or not os.path.exists(self.file_path):
+            self._load_complete()
+            return self._sections[key]
+        
+        with open(self.file_path, 'rb') as file:
+            for value in ijson.items(file, key, use_float=True):
+                self._sections[key] = value
+                return value
+        self._absent.add(key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        self._load_complete()
+        return iter(self._sections)
+    
+    def __len__(self) -> int:
+        self._load_complete()
+        return len(self._sections)
+
 class DenialManagementMemoryService:
     """
     A service that integrates all knowledge bases through VertexAIRagMemoryService
@@ -33,18 +114,23 @@ class DenialManagementMemoryService:
         self.dont_bill_together_path = os.path.join("knowledge_base", "dont_bill_together", "dont_bill_together_knowledge.json")
         self.resolution_path = os.path.join("knowledge_base", "resolution", "resolution_knowledge.json")
         
-        # Load knowledge bases
-        self.carc_rarc_kb = self._load_json(self.carc_rarc_path)
-        self.dont_bill_together_kb = self._load_json(self.dont_bill_together_path)
-        self.resolution_kb = self._load_json(self.resolution_path)
+        # Read buffer shared by all knowledge base loads (grown on demand)
+        self._read_buffer = bytearray()
+        
+        # Load knowledge bases (large files are parsed section by section on first use)
+        self.carc_rarc_kb = self._open_knowledge_base(self.carc_rarc_path)
+        self.dont_bill_together_kb = self._open_knowledge_base(self.dont_bill_together_path)
+        self.resolution_kb = self._open_knowledge_base(self.resolution_path)
         
         # Initialize memory services
         self.carc_rarc_memory = self._initialize_memory_service("carc-rarc-knowledge")
         self.dont_bill_together_memory = self._initialize_memory_service("dont-bill-together-knowledge")
         self.resolution_memory = self._initialize_memory_service("resolution-knowledge")
         
-        # Session context storage
-        self.session_memory = {}
+        # Session context storage, bounded and evicted least recently used first
+        self.max_sessions = int(os.getenv("MEMORY_MAX_SESSIONS", 1000))
+        self.max_history_turns = int(os.getenv("MEMORY_MAX_HISTORY_TURNS", 100))
+        self.session_memory = OrderedDict()
         
         # Performance metrics
         self.metrics = {
@@ -55,10 +141,37 @@ class DenialManagementMemoryService:
             "failed_queries": 0
         }
     
+    def _open_knowledge_base(self, file_path: str) -> Mapping:
+        """
+        Load a knowledge base, deferring parsing only for large files.
+        
+        Files smaller than STREAMING_THRESHOLD_BYTES, or any file when ijson
+        is not installed, are parsed in one pass into a plain dict. Larger
+        files are wrapped in a LazyKnowledgeBase.
+        
+        Args:
+            file_path: Path to the knowledge base JSON file
+            
+        Returns:
+            The knowledge base as a dict or a LazyKnowledgeBase
+        """
+        if (
+            ijson is not None
+            and os.path.exists(file_path)
+            and os.path.getsize(file_path) >= STREAMING_THRESHOLD_BYTES
+        ):
+            return LazyKnowledgeBase(file_path, self._load_json)
+        
+        return self._load_json(file_path)
+    
     def _load_json(self, file_path: str) -> Dict[str, Any]:
         """
         Load JSON data from a file.
         
+        The file is read unbuffered in a single call into a reusable buffer,
+        so loading several knowledge bases does not allocate a new bytes
+        object per file.
+        
         Args:
             file_path: Path to the JSON file
             
@@ -67,8 +180,18 @@ class DenialManagementMemoryService:
         """
         try:
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    return json.load(file)
+                with open(file_path, 'rb', buffering=0) as file:
+                    size = os.fstat(file.fileno()).st_size
+                    if len(self._read_buffer) < size:
+                        self._read_buffer = bytearray(size)
+                    with memoryview(self._read_buffer) as buffer:
+                        data = buffer[:file.readinto(buffer[:size])]
+                        if orjson is not None:
+                            kb_data = orjson.loads(data)
+                        else:
+                            kb_data = json.loads(data.tobytes())
+                
+                return kb_data
             else:
                 print(f"Warning: {file_path} does not exist. Returning empty dictionary.")
                 return {}
@@ -94,7 +217,7 @@ class DenialManagementMemoryService:
             index_id=index_id
         )
     
-    def _measure_query_performance(self, fn):
+    def _measure_query_performance(fn):
         """
         Decorator to measure query performance.
         
@@ -104,12 +227,13 @@ class DenialManagementMemoryService:
         Returns:
             Wrapped function with performance measurement
         """
-        def wrapper(*args, **kwargs):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
             start_time = time.time()
             self.metrics["query_count"] += 1
             
             try:
-                result = fn(*args, **kwargs)
+                result = fn(self, *args, **kwargs)
                 self.metrics["successful_queries"] += 1
                 return result
             except Exception as e:
@@ -132,13 +256,39 @@ class DenialManagementMemoryService:
             session_id: Unique identifier for the session
         """
         self.session_memory[session_id] = {
-            "conversation_history": [],
+            "conversation_history": deque(maxlen=self.max_history_turns),
             "context": {},
             "documents": {},
             "created_at": time.time()
         }
+        self.session_memory.move_to_end(session_id)
+        
+        # Evict the least recently used sessions past the cap
+        while len(self.session_memory) > self.max_sessions:
+            self.session_memory.popitem(last=False)
         print(f"Session {session_id} initialized.")
     
+    def _get_session(self, session_id: str, create: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Look up a session and mark it as most recently used.
+        
+        Args:
+            session_id: Unique identifier for the session
+            create: Whether to initialize the session if it does not exist
+            
+        Returns:
+            The session dictionary, or None if not found and create is False
+        """
+        session = self.session_memory.get(session_id)
+        if session is None:
+            if not create:
+                return None
+            self.initialize_session(session_id)
+            return self.session_memory[session_id]
+        
+        self.session_memory.move_to_end(session_id)
+        return session
+    
     def add_to_session_context(self, session_id: str, key: str, value: Any) -> None:
         """
         Add information to the session context.
@@ -148,10 +298,7 @@ class DenialManagementMemoryService:
             key: Context key
             value: Context value
         """
-        if session_id not in self.session_memory:
-            self.initialize_session(session_id)
-        
-        self.session_memory[session_id]["context"][key] = value
+        self._get_session(session_id, create=True)["context"][key] = value
     
     def add_conversation_turn(self, session_id: str, user_message: str, agent_response: str) -> None:
         """
@@ -162,10 +309,7 @@ class DenialManagementMemoryService:
             user_message: Message from the user
             agent_response: Response from the agent
         """
-        if session_id not in self.session_memory:
-            self.initialize_session(session_id)
-        
-        self.session_memory[session_id]["conversation_history"].append({
+        self._get_session(session_id, create=True)["conversation_history"].append({
             "user": user_message,
             "agent": agent_response,
             "timestamp": time.time()
@@ -182,18 +326,21 @@ class DenialManagementMemoryService:
         Returns:
             The context value for the key, or the entire context if key is None
         """
-        if session_id not in self.session_memory:
+        session = self._get_session(session_id)
+        if session is None:
             return None
         
         if key is None:
-            return self.session_memory[session_id]["context"]
+            return session["context"]
         
-        return self.session_memory[session_id]["context"].get(key)
+        return session["context"].get(key)
     
     def get_conversation_history(self, session_id: str, max_turns: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get conversation history for a session.
         
+        Only the most recent max_history_turns turns are retained per session.
+        
         Args:
             session_id: Unique identifier for the session
             max_turns: Maximum number of turns to retrieve (most recent)
@@ -201,15 +348,16 @@ class DenialManagementMemoryService:
         Returns:
             List of conversation turns
         """
-        if session_id not in self.session_memory:
+        session = self._get_session(session_id)
+        if session is None:
             return []
         
-        history = self.session_memory[session_id]["conversation_history"]
+        history = session["conversation_history"]
         
         if max_turns is not None:
-            return history[-max_turns:]
+            return list(islice(history, max(0, len(history) - max_turns), None))
         
-        return history
+        return list(history)
     
     @_measure_query_performance
     def query_carc_information(self, carc_code: str) -> Dict[str, Any]:
@@ -422,6 +570,21 @@ class DenialManagementMemoryService:
             print(f"Session {session_id} cleared from memory.")
 
 
+def _pretty_json(data: Any) -> str:
+    """
+    Format data as indented JSON for display, using orjson when available.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        Indented JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
 def run_memory_service_integration_example():
     """
     Example usage of the DenialManagementMemoryService.
@@ -439,22 +602,22 @@ def run_memory_service_integration_example():
     # Example: Query CARC information
     carc_info = memory_service.query_carc_information("16")
     print("\nCARC Information Example:")
-    print(json.dumps(carc_info, indent=2))
+    print(_pretty_json(carc_info))
     
     # Example: Check code compatibility
     compatibility = memory_service.check_code_compatibility("80061", "82465")
     print("\nCode Compatibility Example:")
-    print(json.dumps(compatibility, indent=2))
+    print(_pretty_json(compatibility))
     
     # Example: Get denial resolution strategy
     resolution = memory_service.get_denial_resolution_strategy(carc_code="16")
     print("\nDenial Resolution Strategy Example:")
-    print(json.dumps(resolution, indent=2))
+    print(_pretty_json(resolution))
     
     # Example: Semantic search
     search_results = memory_service.semantic_search("missing information claim")
     print("\nSemantic Search Example:")
-    print(json.dumps(search_results, indent=2))
+    print(_pretty_json(search_results))
     
     # Example: Add conversation turn
     memory_service.add_conversation_turn(
@@ -466,12 +629,12 @@ def run_memory_service_integration_example():
     # Example: Get conversation history
     history = memory_service.get_conversation_history(session_id)
     print("\nConversation History Example:")
-    print(json.dumps(history, indent=2))
+    print(_pretty_json(history))
     
     # Example: Get performance metrics
     metrics = memory_service.get_performance_metrics()
     print("\nPerformance Metrics Example:")
-    print(json.dumps(metrics, indent=2))
+    print(_pretty_json(metrics))
 
 
 if __name__ == "__main__":
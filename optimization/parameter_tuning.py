@@ -2,26 +2,51 @@
 
 import os
 import json
+import asyncio
 import time
 import datetime
+import hashlib
+import itertools
+import secrets
 import uuid
 import logging
-import copy
-from typing import Dict, List, Any, Optional, Callable, Union, Tuple
+import pickle
+from typing import Dict, List, Any, Optional, Callable, Union, Tuple, Iterable
 import concurrent.futures
+from collections import defaultdict
+import heapq
+import multiprocessing as mp
+import pathlib
+
+import numpy as np
+
+try:
+    import optuna
+except ImportError:
+    optuna = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from evaluation.pipeline import EvaluationPipeline, TestScenario
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("parameter_tuning")
 
 class ModelParameter:
     """Representation of a model parameter for tuning."""
     
+    __slots__ = (
+        "name",
+        "parameter_type",
+        "default_value",
+        "min_value",
+        "max_value",
+        "choices",
+        "description",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -126,6 +151,16 @@ class ModelParameter:
 class ModelConfiguration:
     """Representation of a model configuration for tuning."""
     
+    __slots__ = (
+        "config_id",
+        "parameters",
+        "metadata",
+        "description",
+        "timestamp",
+        "evaluation_results",
+        "_dict_cache",
+    )
+    
     def __init__(
         self,
         config_id: Optional[str] = None,
@@ -147,6 +182,16 @@ class ModelConfiguration:
         self.description = description
         self.timestamp = datetime.datetime.now().timestamp()
         self.evaluation_results = {}
+        self._dict_cache = None
+    
+    def _freeze(self):
+        """Cache the dictionary form of a configuration that is done changing.
+        
+        Called once evaluation results are final; to_dict then returns the
+        cached dictionary. Freezing again refreshes the cache.
+        """
+        self._dict_cache = None
+        self._dict_cache = self.to_dict()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary.
@@ -154,6 +199,9 @@ class ModelConfiguration:
         Returns:
             Dictionary representation of the configuration
         """
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
         return {
             "config_id": self.config_id,
             "parameters": self.parameters,
@@ -194,7 +242,10 @@ class ParameterTuner:
         parameter_definitions: Dict[str, ModelParameter],
         evaluation_scenarios_dir: str,
         results_dir: str,
-        max_concurrent_evaluations: int = 3
+        max_concurrent_evaluations: int = 3,
+        max_concurrent_scenarios: int = 8,
+        cache_tag: Optional[str] = None,
+        parallel_execution: bool = True
     ):
         """Initialize parameter tuner.
         
@@ -204,21 +255,61 @@ class ParameterTuner:
             evaluation_scenarios_dir: Directory containing evaluation scenarios
             results_dir: Directory to save tuning results
             max_concurrent_evaluations: Maximum number of concurrent evaluations
+            max_concurrent_scenarios: Maximum number of scenarios evaluated at
+                once within a single configuration
+            cache_tag: Optional version tag of the agent pipeline being tuned.
+                When given, complete evaluations are memoized in the results
+                directory under this tag; None disables the evaluation cache
+            parallel_execution: Whether the scenarios of a configuration run
+                concurrently
         """
         self.base_configuration = base_configuration
         self.parameter_definitions = parameter_definitions
         self.evaluation_scenarios_dir = evaluation_scenarios_dir
         self.results_dir = results_dir
         self.max_concurrent_evaluations = max_concurrent_evaluations
+        self.max_concurrent_scenarios = max_concurrent_scenarios
+        self.cache_tag = cache_tag
+        self.parallel_execution = parallel_execution
         
         # Create directories if they don't exist
-        os.makedirs(results_dir, exist_ok=True)
+        self._results_path = pathlib.Path(results_dir)
+        self._results_path.mkdir(parents=True, exist_ok=True)
+        
+        # Metrics of evaluated parameter sets, keyed by a hash of the parameters,
+        # the scenarios and the cache tag
+        self._cache_path = self._results_path / "_eval_cache"
+        if cache_tag is not None:
+            self._cache_path.mkdir(exist_ok=True)
+        self._scenario_fingerprint: Optional[str] = None
+        
+        # Configurations evaluated by this tuner, so reports don't re-read them from disk
+        self._config_cache: Dict[str, ModelConfiguration] = {}
+        
+        # Configuration IDs are a per-tuner random prefix plus a counter, so they
+        # sort in generation order and don't collide across runs sharing results_dir
+        self._id_prefix = secrets.token_hex(4)
+        self._id_counter = itertools.count()
+        
+        # Random generator for the "random" variation strategy
+        self._rng = np.random.default_rng()
+        
+        # Scenarios are immutable, so they are read from disk once and shared by all evaluations
+        self._scenarios: Optional[List[TestScenario]] = None
         
         # Initialize parameters with default values if not in base configuration
         for param_name, param_def in parameter_definitions.items():
             if param_name not in self.base_configuration.parameters:
                 self.base_configuration.parameters[param_name] = param_def.default_value
     
+    def _new_config_id(self) -> str:
+        """Generate an ID for a new configuration.
+        
+        Returns:
+            Configuration ID
+        """
+        return f"cfg_{self._id_prefix}_{next(self._id_counter):08x}"
+    
     def generate_configurations(
         self,
         parameters_to_tune: List[str],
@@ -243,7 +334,7 @@ class ParameterTuner:
         # Generate variations for each parameter
         for param_name in parameters_to_tune:
             if param_name not in self.parameter_definitions:
-                logger.warning(f"Parameter {param_name} not found in definitions, skipping")
+                logger.warning("Parameter %s not found in definitions, skipping", param_name)
                 continue
                 
             param_def = self.parameter_definitions[param_name]
@@ -251,15 +342,17 @@ class ParameterTuner:
             
             # Create a new configuration for each variation
             for variation_value in variations:
-                config = copy.deepcopy(self.base_configuration)
-                config.config_id = str(uuid.uuid4())
+                config = ModelConfiguration(
+                    config_id=self._new_config_id(),
+                    parameters=dict(self.base_configuration.parameters),
+                    metadata={
+                        "varied_parameter": param_name,
+                        "variation_strategy": variation_strategy,
+                        "base_config_id": self.base_configuration.config_id
+                    },
+                    description=f"Variation of {param_name} = {variation_value}"
+                )
                 config.parameters[param_name] = variation_value
-                config.metadata = {
-                    "varied_parameter": param_name,
-                    "variation_strategy": variation_strategy,
-                    "base_config_id": self.base_configuration.config_id
-                }
-                config.description = f"Variation of {param_name} = {variation_value}"
                 
                 configurations.append(config)
         
@@ -281,8 +374,6 @@ class ParameterTuner:
         Returns:
             List of parameter values
         """
-        import random
-        
         if param_def.parameter_type == "bool":
             # Boolean has only two possible values
             return [True, False]
@@ -297,24 +388,23 @@ class ParameterTuner:
                 # Without range bounds, use multipliers around default
                 default = param_def.default_value
                 if strategy == "linear":
-                    multipliers = [0.5, 0.75, 1.25, 1.5, 2.0][:num_variations]
-                    return [default * m for m in multipliers]
+                    multipliers = np.array([0.5, 0.75, 1.25, 1.5, 2.0][:num_variations])
                 else:  # random
-                    return [default * random.uniform(0.5, 2.0) for _ in range(num_variations)]
+                    multipliers = self._rng.uniform(0.5, 2.0, num_variations)
+                return (default * multipliers).tolist()
             else:
-                # With range bounds, generate values within the range
+                # With range bounds, generate values within the range (exclusive of the bounds)
                 min_val, max_val = param_def.min_value, param_def.max_value
                 if strategy == "linear":
-                    step = (max_val - min_val) / (num_variations + 1)
-                    values = [min_val + step * (i + 1) for i in range(num_variations)]
+                    values = np.linspace(min_val, max_val, num_variations + 2)[1:-1]
                 else:  # random
-                    values = [random.uniform(min_val, max_val) for _ in range(num_variations)]
+                    values = self._rng.uniform(min_val, max_val, num_variations)
                 
                 # Convert to int if needed
                 if param_def.parameter_type == "int":
-                    values = [int(v) for v in values]
+                    values = values.astype(np.int64)
                 
-                return values
+                return values.tolist()
                 
         elif param_def.parameter_type == "string":
             # String variations not supported - return empty list
@@ -322,75 +412,183 @@ class ParameterTuner:
             return []
             
         else:
-            logger.warning(f"Unsupported parameter type: {param_def.parameter_type}")
+            logger.warning("Unsupported parameter type: %s", param_def.parameter_type)
             return []
     
+    def _get_scenarios(self) -> List[TestScenario]:
+        """Get the evaluation scenarios, loading them on first use.
+        
+        Returns:
+            List of TestScenario instances
+        """
+        if self._scenarios is None:
+            self._scenarios = TestScenario.load_dir(self.evaluation_scenarios_dir)
+        return self._scenarios
+    
+    def _evaluation_cache_file(self, parameters: Dict[str, Any]) -> Optional[pathlib.Path]:
+        """Get the evaluation cache file for a set of parameter values.
+        
+        The key covers the parameter values, the cache tag and a fingerprint
+        of the scenario IDs and contents, so changing the scenarios or the
+        tagged pipeline version never reuses stale metrics.
+        
+        Args:
+            parameters: Dictionary of parameter values
+            
+        Returns:
+            Path of the cache file, or None if the cache is disabled
+        """
+        if self.cache_tag is None:
+            return None
+        
+        if self._scenario_fingerprint is None:
+            scenarios = sorted(self._get_scenarios(), key=lambda scenario: scenario.scenario_id)
+            self._scenario_fingerprint = _content_key([scenario.to_dict() for scenario in scenarios])
+        
+        key = _content_key({
+            "parameters": parameters,
+            "scenarios": self._scenario_fingerprint,
+            "cache_tag": self.cache_tag
+        })
+        return self._cache_path / f"{key}.json"
+    
     def evaluate_configuration(
         self,
         configuration: ModelConfiguration,
-        apply_config_func: Callable[[Dict[str, Any]], None]
+        apply_config_func: Callable[[Dict[str, Any]], None],
+        trial: Optional[Any] = None
     ) -> Dict[str, float]:
         """Evaluate a single configuration.
         
+        When an Optuna trial is given, scenarios are evaluated one at a time
+        and the running overall score is reported after each, so the
+        study's pruner can stop unpromising configurations early. A pruned
+        configuration is saved with its partial metrics before
+        optuna.TrialPruned is raised.
+        
+        Otherwise scenarios run concurrently on a private event loop when
+        parallel execution is enabled. Called from inside a running event
+        loop, or with parallel execution disabled, the pipeline's synchronous
+        evaluate_all is used instead.
+        
+        When the tuner has a cache tag, complete evaluations are memoized, so
+        a configuration whose parameters were already evaluated against the
+        same scenarios and tag reuses the stored metrics without running the
+        scenarios again.
+        
         Args:
             configuration: Configuration to evaluate
             apply_config_func: Function to apply configuration parameters
+            trial: Optional Optuna trial to report intermediate scores to
             
         Returns:
             Dictionary of evaluation metrics
         """
-        logger.info(f"Evaluating configuration {configuration.config_id}")
+        logger.info("Evaluating configuration %s", configuration.config_id)
+        
+        # Reuse metrics of an identical parameter set evaluated earlier
+        cache_path = self._evaluation_cache_file(configuration.parameters)
+        if cache_path is not None and cache_path.exists():
+            metrics = _read_json(cache_path)
+            logger.info("Reusing cached evaluation for configuration %s", configuration.config_id)
+            configuration.evaluation_results = metrics
+            configuration._freeze()
+            self._save_configuration(configuration)
+            self._config_cache[configuration.config_id] = configuration
+            return metrics
         
         # Apply configuration
         apply_config_func(configuration.parameters)
         
-        # Create results directory for this configuration
-        config_results_dir = os.path.join(
-            self.results_dir,
-            f"config_{configuration.config_id}"
-        )
-        os.makedirs(config_results_dir, exist_ok=True)
-        
-        # Run evaluation
+        # Run evaluation; the pipeline creates its own results directory
         pipeline = EvaluationPipeline(
             scenarios_dir=self.evaluation_scenarios_dir,
-            results_dir=config_results_dir,
-            parallel_execution=True
+            results_dir=str(self._results_path / f"config_{configuration.config_id}"),
+            parallel_execution=self.parallel_execution,
+            scenarios=self._get_scenarios()
         )
         
-        results = pipeline.evaluate_all()
+        if trial is not None:
+            results = (result for _, result in pipeline.evaluate_iter())
+        elif pipeline.parallel_execution and not _event_loop_running():
+            results = asyncio.run(
+                pipeline.evaluate_all_async(self.max_concurrent_scenarios)
+            ).values()
+        else:
+            # asyncio.run cannot nest in a running event loop; the synchronous
+            # path still honors the pipeline's parallel_execution setting
+            results = pipeline.evaluate_all().values()
         
-        # Extract summary metrics
-        metrics = {}
-        overall_scores = []
-        category_scores = {}
+        # Fold each result into running totals instead of keeping every summary
+        totals = defaultdict(float)
+        counts = defaultdict(int)
+        counts["overall_score"] = 0
         
-        for result in results.values():
-            summary = result.get_summary()
-            overall_scores.append(summary["overall_score"])
+        for step, result in enumerate(results):
+            self._accumulate_summary(result.get_summary(), totals, counts)
             
-            # Aggregate category scores
-            for category, data in summary["by_category"].items():
-                if category not in category_scores:
-                    category_scores[category] = []
-                category_scores[category].append(data["average"])
-        
-        # Calculate averages
-        import statistics
-        
-        metrics["overall_score"] = statistics.mean(overall_scores) if overall_scores else 0
+            if trial is not None:
+                trial.report(totals["overall_score"] / counts["overall_score"], step)
+                
+                if trial.should_prune():
+                    configuration.metadata["pruned_after_scenarios"] = counts["overall_score"]
+                    configuration.evaluation_results = self._average_totals(totals, counts)
+                    configuration._freeze()
+                    self._save_configuration(configuration)
+                    self._config_cache[configuration.config_id] = configuration
+                    raise optuna.TrialPruned(f"Pruned after {counts['overall_score']} scenarios")
         
-        for category, scores in category_scores.items():
-            metrics[f"category_{category}"] = statistics.mean(scores) if scores else 0
+        metrics = self._average_totals(totals, counts)
         
         # Store evaluation results in the configuration
         configuration.evaluation_results = metrics
+        configuration._freeze()
         
         # Save configuration results
         self._save_configuration(configuration)
+        self._config_cache[configuration.config_id] = configuration
+        if cache_path is not None:
+            _write_json_atomic(cache_path, metrics)
         
         return metrics
     
+    @staticmethod
+    def _accumulate_summary(
+        summary: Dict[str, Any],
+        totals: Dict[str, float],
+        counts: Dict[str, int]
+    ):
+        """Add one scenario result summary to running metric totals.
+        
+        Args:
+            summary: Evaluation result summary
+            totals: Running sum per metric name
+            counts: Number of values added per metric name
+        """
+        totals["overall_score"] += summary["overall_score"]
+        counts["overall_score"] += 1
+        
+        for category, data in summary["by_category"].items():
+            metric_name = f"category_{category}"
+            totals[metric_name] += data["average"]
+            counts[metric_name] += 1
+    
+    @staticmethod
+    def _average_totals(totals: Dict[str, float], counts: Dict[str, int]) -> Dict[str, float]:
+        """Turn running metric totals into configuration metrics.
+        
+        Args:
+            totals: Running sum per metric name
+            counts: Number of values added per metric name
+            
+        Returns:
+            Dictionary of evaluation metrics
+        """
+        return {
+            metric_name: totals[metric_name] / count if count else 0.0
+            for metric_name, count in counts.items()
+        }
+    
     def evaluate_configurations(
         self,
         configurations: List[ModelConfiguration],
@@ -400,19 +598,43 @@ class ParameterTuner:
         
         Args:
             configurations: List of configurations to evaluate
-            apply_config_func: Function to apply configuration parameters
+            apply_config_func: Module-level (picklable) function to apply
+                configuration parameters; TypeError is raised if it cannot
+                be pickled for the worker processes
             
         Returns:
             Dictionary mapping configuration IDs to evaluation metrics
         """
+        # Fail once up front rather than once per configuration in the pool
+        try:
+            pickle.dumps(apply_config_func)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise TypeError(
+                f"apply_config_func must be picklable (a module-level function) "
+                f"to run in worker processes: {e}"
+            ) from e
+        
         results = {}
+        scenarios = self._get_scenarios()
         
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.max_concurrent_evaluations
+        # Each configuration runs in its own process so applied parameters
+        # cannot leak between concurrent evaluations
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_concurrent_evaluations,
+            mp_context=mp.get_context("spawn")
         ) as executor:
-            # Create a copy of apply_config_func for each configuration
             future_to_config = {
-                executor.submit(self.evaluate_configuration, config, apply_config_func): config
+                executor.submit(
+                    _evaluate_configuration_worker,
+                    config.to_dict(),
+                    self.evaluation_scenarios_dir,
+                    self.results_dir,
+                    apply_config_func,
+                    scenarios,
+                    self.max_concurrent_scenarios,
+                    self.cache_tag,
+                    self.parallel_execution
+                ): config
                 for config in configurations
             }
             
@@ -420,27 +642,201 @@ class ParameterTuner:
                 config = future_to_config[future]
                 try:
                     metrics = future.result()
+                    config.evaluation_results = metrics
+                    config._freeze()
+                    self._config_cache[config.config_id] = config
                     results[config.config_id] = metrics
                 except Exception as e:
-                    logger.error(f"Error evaluating configuration {config.config_id}: {e}")
+                    logger.error("Error evaluating configuration %s: %s", config.config_id, e)
         
         return results
     
+    def bayesian_search(
+        self,
+        parameters_to_tune: List[str],
+        n_trials: int,
+        apply_config_func: Callable[[Dict[str, Any]], None],
+        metric: str = "overall_score",
+        patience: Optional[int] = None,
+        study_name: str = "parameter_tuning",
+        seed: Optional[int] = None,
+        pruning: bool = True
+    ) -> Dict[str, Dict[str, float]]:
+        """Search parameter values with an Optuna TPE study.
+        
+        Each trial samples values for the tuned parameters, evaluates the
+        resulting configuration and reports the chosen metric back to the
+        sampler. With pruning enabled, a Hyperband pruner stops trials whose
+        running score falls behind after a few scenarios; their partial
+        metrics are still returned, but find_best_configuration and
+        generate_optimization_report leave them out of the ranking. The study is stored in a SQLite database
+        in the results directory, so re-running with the same study name
+        resumes it.
+        
+        Args:
+            parameters_to_tune: List of parameter names to tune
+            n_trials: Maximum number of trials to run
+            apply_config_func: Function to apply configuration parameters
+            metric: Metric to maximize
+            patience: Stop once this many trials pass without improving the
+                best value (None to always run n_trials)
+            study_name: Name of the persisted study
+            seed: Optional sampler seed for reproducible searches
+            pruning: Whether to stop unpromising trials early
+            
+        Returns:
+            Dictionary mapping configuration IDs to evaluation metrics
+        """
+        if optuna is None:
+            raise ImportError("bayesian_search requires optuna; install it or use generate_configurations")
+        
+        param_defs = []
+        for param_name in parameters_to_tune:
+            if param_name not in self.parameter_definitions:
+                logger.warning("Parameter %s not found in definitions, skipping", param_name)
+                continue
+            param_defs.append(self.parameter_definitions[param_name])
+        
+        evaluated_configs = {}
+        
+        def objective(trial) -> float:
+            parameters = dict(self.base_configuration.parameters)
+            for param_def in param_defs:
+                value = self._suggest_parameter(trial, param_def)
+                if value is not None:
+                    parameters[param_def.name] = value
+            
+            config = ModelConfiguration(
+                config_id=self._new_config_id(),
+                parameters=parameters,
+                metadata={
+                    "search_strategy": "tpe",
+                    "trial_number": trial.number,
+                    "base_config_id": self.base_configuration.config_id
+                },
+                description=f"TPE trial {trial.number}"
+            )
+            trial.set_user_attr("config_id", config.config_id)
+            
+            try:
+                metrics = self.evaluate_configuration(
+                    config, apply_config_func, trial=trial if pruning else None
+                )
+            except optuna.TrialPruned:
+                evaluated_configs[config.config_id] = config.evaluation_results
+                raise
+            evaluated_configs[config.config_id] = metrics
+            return metrics.get(metric, 0)
+        
+        callbacks = []
+        if patience is not None:
+            def stop_on_plateau(study, trial):
+                try:
+                    best_number = study.best_trial.number
+                except ValueError:
+                    return
+                if trial.number - best_number >= patience:
+                    logger.info("No improvement in %s trials, stopping search", patience)
+                    study.stop()
+            callbacks.append(stop_on_plateau)
+        
+        storage = optuna.storages.RDBStorage(
+            url=f"sqlite:///{(self._results_path / 'optuna_study.db').resolve()}"
+        )
+        study = optuna.create_study(
+            study_name=study_name,
+            storage=storage,
+            sampler=optuna.samplers.TPESampler(seed=seed),
+            pruner=(
+                optuna.pruners.HyperbandPruner(min_resource=4, max_resource="auto", reduction_factor=3)
+                if pruning else optuna.pruners.NopPruner()
+            ),
+            direction="maximize",
+            load_if_exists=True
+        )
+        study.optimize(objective, n_trials=n_trials, callbacks=callbacks)
+        
+        return evaluated_configs
+    
+    def _suggest_parameter(self, trial, param_def: ModelParameter) -> Any:
+        """Sample a value for a parameter from an Optuna trial.
+        
+        Args:
+            trial: Optuna trial
+            param_def: Parameter definition
+            
+        Returns:
+            Sampled value, or None if the parameter type cannot be searched
+        """
+        if param_def.parameter_type == "bool":
+            return trial.suggest_categorical(param_def.name, [True, False])
+            
+        elif param_def.parameter_type == "categorical":
+            return trial.suggest_categorical(param_def.name, param_def.choices)
+            
+        elif param_def.parameter_type in ["float", "int"]:
+            if param_def.min_value is None or param_def.max_value is None:
+                # Without range bounds, search the same span as the multiplier variations
+                low, high = sorted((param_def.default_value * 0.5, param_def.default_value * 2.0))
+            else:
+                low, high = param_def.min_value, param_def.max_value
+                
+            if param_def.parameter_type == "int":
+                return trial.suggest_int(param_def.name, int(low), int(high))
+            return trial.suggest_float(param_def.name, low, high)
+            
+        else:
+            logger.warning("Unsupported parameter type for search: %s", param_def.parameter_type)
+            return None
+    
     def _save_configuration(self, configuration: ModelConfiguration):
         """Save configuration to file.
         
         Args:
             configuration: Configuration to save
         """
-        file_path = os.path.join(
-            self.results_dir,
-            f"config_{configuration.config_id}.json"
-        )
+        file_path = self._config_path(configuration.config_id)
+        
+        _write_json_atomic(file_path, configuration.to_dict())
+            
+        logger.info("Saved configuration to %s", file_path)
+    
+    def _config_path(self, config_id: str) -> pathlib.Path:
+        """Get the path of a configuration's JSON file.
+        
+        Args:
+            config_id: Configuration ID
+            
+        Returns:
+            Path of the configuration file
+        """
+        return self._results_path / f"config_{config_id}.json"
+    
+    def _get_configuration(self, config_id: str) -> ModelConfiguration:
+        """Get an evaluated configuration, reading it from disk only if not cached.
+        
+        Args:
+            config_id: Configuration ID
+            
+        Returns:
+            ModelConfiguration instance
+        """
+        configuration = self._config_cache.get(config_id)
+        if configuration is None:
+            configuration = ModelConfiguration.from_dict(_read_json(self._config_path(config_id)))
+            self._config_cache[config_id] = configuration
+        return configuration
+    
+    def _is_pruned(self, config_id: str) -> bool:
+        """Check whether a configuration's evaluation was stopped early.
         
-        with open(file_path, 'w') as f:
-            json.dump(configuration.to_dict(), f, indent=2)
+        Args:
+            config_id: Configuration ID
             
-        logger.info(f"Saved configuration to {file_path}")
+        Returns:
+            True if the configuration only has partial metrics
+        """
+        return "pruned_after_scenarios" in self._get_configuration(config_id).metadata
     
     def find_best_configuration(
         self,
@@ -449,6 +845,9 @@ class ParameterTuner:
     ) -> Tuple[str, ModelConfiguration]:
         """Find the best configuration based on a metric.
         
+        Pruned configurations are skipped, since their metrics only cover
+        the scenarios evaluated before they were stopped.
+        
         Args:
             evaluated_configs: Dictionary mapping configuration IDs to metrics
             metric: Metric to optimize
@@ -456,26 +855,17 @@ class ParameterTuner:
         Returns:
             Tuple of (config_id, configuration)
         """
-        if not evaluated_configs:
+        completed_ids = [cid for cid in evaluated_configs if not self._is_pruned(cid)]
+        if not completed_ids:
             return None, None
             
         # Find config with highest metric value
         best_config_id = max(
-            evaluated_configs.keys(),
+            completed_ids,
             key=lambda cid: evaluated_configs[cid].get(metric, 0)
         )
         
-        # Load the configuration
-        config_path = os.path.join(
-            self.results_dir,
-            f"config_{best_config_id}.json"
-        )
-        
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            best_config = ModelConfiguration.from_dict(config_data)
-            
-        return best_config_id, best_config
+        return best_config_id, self._get_configuration(best_config_id)
     
     def generate_optimization_report(
         self,
@@ -484,6 +874,10 @@ class ParameterTuner:
     ) -> Dict[str, Any]:
         """Generate optimization report.
         
+        Fully evaluated configurations are ranked by the metric. Pruned
+        configurations are listed separately under "pruned_results" with
+        their partial metrics and never chosen as the best configuration.
+        
         Args:
             evaluated_configs: Dictionary mapping configuration IDs to metrics
             metric: Metric to compare
@@ -494,62 +888,195 @@ class ParameterTuner:
         if not evaluated_configs:
             return {"error": "No configurations evaluated"}
             
-        # Sort configurations by metric
-        sorted_configs = sorted(
-            evaluated_configs.items(),
-            key=lambda x: x[1].get(metric, 0),
-            reverse=True
+        completed = []
+        pruned_results = []
+        for config_id, metrics in evaluated_configs.items():
+            if self._is_pruned(config_id):
+                configuration = self._get_configuration(config_id)
+                pruned_results.append({
+                    "config_id": config_id,
+                    "parameters": configuration.parameters,
+                    "metadata": configuration.metadata,
+                    "metrics": metrics
+                })
+            else:
+                completed.append((config_id, metrics))
+        
+        # Order configurations best first; ties keep their evaluation order
+        best_first = heapq.nlargest(
+            len(completed),
+            completed,
+            key=lambda item: item[1].get(metric, 0)
         )
         
-        # Extract parameter values
-        config_params = {}
-        for config_id, _ in sorted_configs:
-            config_path = os.path.join(
-                self.results_dir,
-                f"config_{config_id}.json"
-            )
-            
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
-                config_params[config_id] = {
-                    "parameters": config_data["parameters"],
-                    "metadata": config_data.get("metadata", {})
-                }
+        # Collect results with their parameter values
+        results = []
+        for config_id, metrics in best_first:
+            configuration = self._get_configuration(config_id)
+            results.append({
+                "config_id": config_id,
+                "parameters": configuration.parameters,
+                "metadata": configuration.metadata,
+                "metrics": metrics
+            })
         
         # Generate report
+        now = datetime.datetime.now()
         report = {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "metric": metric,
             "num_configurations": len(evaluated_configs),
             "base_configuration": self.base_configuration.to_dict(),
-            "results": [
-                {
-                    "config_id": config_id,
-                    "parameters": config_params[config_id]["parameters"],
-                    "metadata": config_params[config_id]["metadata"],
-                    "metrics": metrics
-                }
-                for config_id, metrics in sorted_configs
-            ]
+            "results": results,
+            "pruned_results": pruned_results,
+            "best_configuration_id": best_first[0][0] if best_first else None
         }
         
-        # Identify best configuration
-        best_config_id, _ = self.find_best_configuration(evaluated_configs, metric)
-        report["best_configuration_id"] = best_config_id
-        
         # Save report
-        report_path = os.path.join(
-            self.results_dir,
-            f"optimization_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        )
+        report_path = self._results_path / f"optimization_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        
+        _write_json_atomic(report_path, report)
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Same results, one per line, for readers that stream them
+        _write_ndjson_atomic(report_path.with_suffix(".ndjson"), results)
             
-        logger.info(f"Generated optimization report at {report_path}")
+        logger.info("Generated optimization report at %s", report_path)
         
         return report
 
+def _event_loop_running() -> bool:
+    """Check whether the current thread is running an asyncio event loop.
+    
+    Returns:
+        True if called from inside a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+def _content_key(data: Any) -> str:
+    """Compute a stable content hash of JSON-serializable data.
+    
+    Args:
+        data: JSON-serializable data to hash
+        
+    Returns:
+        Hex digest identifying the data
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _read_json(file_path: Union[str, pathlib.Path]) -> Any:
+    """Read a JSON file.
+    
+    Args:
+        file_path: Path of the file to read
+        
+    Returns:
+        Parsed JSON data
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _write_json_atomic(file_path: Union[str, pathlib.Path], data: Any):
+    """Write data as indented JSON, replacing the file atomically.
+    
+    The data is written to a temporary file next to the target and moved into
+    place with os.replace, so an interrupted run never leaves a partial file.
+    
+    Args:
+        file_path: Path of the file to write
+        data: JSON-serializable data to write
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _write_ndjson_atomic(file_path: Union[str, pathlib.Path], records: Iterable[Any]):
+    """Write records as newline-delimited JSON, replacing the file atomically.
+    
+    Records are encoded and written one at a time, so no single buffer
+    holds the whole file.
+    
+    Args:
+        file_path: Path of the file to write
+        records: JSON-serializable records, one per line
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            for record in records:
+                if orjson is not None:
+                    f.write(orjson.dumps(
+                        record,
+                        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+                else:
+                    f.write(json.dumps(record).encode('utf-8') + b"\n")
+        os.replace(tmp_path, file_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _evaluate_configuration_worker(
+    config_data: Dict[str, Any],
+    evaluation_scenarios_dir: str,
+    results_dir: str,
+    apply_config_func: Callable[[Dict[str, Any]], None],
+    scenarios: Optional[List[TestScenario]] = None,
+    max_concurrent_scenarios: int = 8,
+    cache_tag: Optional[str] = None,
+    parallel_execution: bool = True
+) -> Dict[str, float]:
+    """Evaluate a configuration in a worker process.
+    
+    Only plain data and a picklable apply function cross the process
+    boundary; the configuration and a tuner are rebuilt in the worker.
+    
+    Args:
+        config_data: Dictionary representation of the configuration
+        evaluation_scenarios_dir: Directory containing evaluation scenarios
+        results_dir: Directory to save tuning results
+        apply_config_func: Module-level function to apply configuration parameters
+        scenarios: Scenarios already loaded by the parent tuner
+        max_concurrent_scenarios: Maximum number of scenarios evaluated at once
+        cache_tag: Cache tag of the parent tuner
+        parallel_execution: Whether the scenarios run concurrently
+        
+    Returns:
+        Dictionary of evaluation metrics
+    """
+    configuration = ModelConfiguration.from_dict(config_data)
+    tuner = ParameterTuner(
+        base_configuration=configuration,
+        parameter_definitions={},
+        evaluation_scenarios_dir=evaluation_scenarios_dir,
+        results_dir=results_dir,
+        max_concurrent_scenarios=max_concurrent_scenarios,
+        cache_tag=cache_tag,
+        parallel_execution=parallel_execution
+    )
+    tuner._scenarios = scenarios
+    return tuner.evaluate_configuration(configuration, apply_config_func)
+
 def apply_default_configuration(parameters: Dict[str, Any]):
     """Apply default configuration to the model.
     
@@ -557,12 +1084,17 @@ def apply_default_configuration(parameters: Dict[str, Any]):
     parameters to the actual model. In a real implementation, this
     would interact with the model's configuration.
     
+    The hook is expected to return immediately, since it runs once per
+    evaluated configuration. To simulate parameter application latency,
+    set the TUNING_SIMULATE_LATENCY environment variable to a delay in
+    seconds.
+    
     Args:
         parameters: Dictionary of parameter values
     """
     # This is a placeholder. In a real implementation, this would
     # apply the parameters to the model.
-    logger.info(f"Applying configuration: {parameters}")
+    logger.info("Applying configuration: %s", parameters)
     
     # Example of parameter application:
     # - temperature affects randomness
@@ -570,8 +1102,10 @@ def apply_default_configuration(parameters: Dict[str, Any]):
     # - max_tokens affects response length
     # - etc.
     
-    # Simulated delay to represent parameter application time
-    time.sleep(0.5)
+    # Optional simulated delay to represent parameter application time
+    simulated_latency = os.getenv("TUNING_SIMULATE_LATENCY")
+    if simulated_latency:
+        time.sleep(float(simulated_latency))
 
 # Define standard model parameters
 STANDARD_PARAMETERS = {
@@ -645,15 +1179,23 @@ def run_parameter_tuning(
     parameters_to_tune: List[str] = None,
     num_variations: int = 3,
     evaluation_scenarios_dir: str = "evaluation/benchmark_data",
-    results_dir: str = "optimization/tuning_results"
+    results_dir: str = "optimization/tuning_results",
+    search_strategy: str = "grid",
+    n_trials: int = 20,
+    cache_tag: Optional[str] = None
 ):
     """Run parameter tuning process.
     
     Args:
         parameters_to_tune: List of parameters to tune
-        num_variations: Number of variations per parameter
+        num_variations: Number of variations per parameter (grid search)
         evaluation_scenarios_dir: Directory containing evaluation scenarios
         results_dir: Directory to save tuning results
+        search_strategy: "grid" to evaluate per-parameter variations, or
+            "tpe" to run a Bayesian search with Optuna
+        n_trials: Number of trials for the "tpe" strategy
+        cache_tag: Optional version tag of the agent pipeline; enables reuse
+            of earlier evaluations made with the same tag and scenarios
     """
     # Use default parameters if none specified
     if parameters_to_tune is None:
@@ -667,22 +1209,30 @@ def run_parameter_tuning(
         base_configuration=base_configuration,
         parameter_definitions=STANDARD_PARAMETERS,
         evaluation_scenarios_dir=evaluation_scenarios_dir,
-        results_dir=results_dir
+        results_dir=results_dir,
+        cache_tag=cache_tag
     )
     
-    # Generate configuration variations
-    configurations = tuner.generate_configurations(
-        parameters_to_tune=parameters_to_tune,
-        num_variations=num_variations
-    )
-    
-    logger.info(f"Generated {len(configurations)} configurations")
-    
-    # Evaluate configurations
-    evaluated_configs = tuner.evaluate_configurations(
-        configurations=configurations,
-        apply_config_func=apply_default_configuration
-    )
+    if search_strategy == "tpe":
+        evaluated_configs = tuner.bayesian_search(
+            parameters_to_tune=parameters_to_tune,
+            n_trials=n_trials,
+            apply_config_func=apply_default_configuration
+        )
+    else:
+        # Generate configuration variations
+        configurations = tuner.generate_configurations(
+            parameters_to_tune=parameters_to_tune,
+            num_variations=num_variations
+        )
+        
+        logger.info("Generated %s configurations", len(configurations))
+        
+        # Evaluate configurations
+        evaluated_configs = tuner.evaluate_configurations(
+            configurations=configurations,
+            apply_config_func=apply_default_configuration
+        )
     
     # Generate report
     report = tuner.generate_optimization_report(evaluated_configs)
@@ -690,11 +1240,19 @@ def run_parameter_tuning(
     # Find best configuration
     best_config_id, best_config = tuner.find_best_configuration(evaluated_configs)
     
-    logger.info(f"Best configuration: {best_config_id}")
-    logger.info(f"Best configuration parameters: {best_config.parameters}")
-    logger.info(f"Best configuration performance: {best_config.evaluation_results}")
+    if best_config is None:
+        logger.warning("No configuration completed evaluation")
+        return report
+    
+    logger.info("Best configuration: %s", best_config_id)
+    logger.info("Best configuration parameters: %s", best_config.parameters)
+    logger.info("Best configuration performance: %s", best_config.evaluation_results)
     
     return report
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     run_parameter_tuning()
@@ -22,6 +22,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.4.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.7.0",
             "isort>=5.12.0",
             "mypy>=1.4.1",
@@ -8,65 +8,139 @@ effective testing of the Medical Billing Denial Agent system.
 import os
 import pytest
 import logging
-from typing import Dict, Any
-
-from agent.core.session_manager import SessionManager
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 # Configure logging for tests
 logging.basicConfig(level=logging.INFO)
 
 
-@pytest.fixture
-def session_manager():
-    """Fixture that provides a SessionManager instance for testing."""
-    return SessionManager()
-
-
-@pytest.fixture
-def sample_session_data() -> Dict[str, Any]:
-    """Fixture that provides sample session data for testing."""
-    return {
-        "conversation_history": [
-            {
-                "timestamp": 1650000000.0,
-                "user_input": "What does CARC code 16 mean?",
-                "agent_response": "CARC code 16 indicates 'Claim/service lacks information or has submission/billing error(s).'",
-                "metadata": {
-                    "task_type": "denial_classification",
-                    "intent": "code_explanation"
-                }
+def pytest_addoption(parser):
+    """Add options for running the slow end-to-end tests."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked slow, parsing the example documents"
+    )
+
+
+def pytest_configure(config):
+    """Register the custom markers (xdist_group also works without pytest-xdist)."""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests sharing a group name on the same pytest-xdist worker"
+    )
+    config.addinivalue_line(
+        "markers",
+        "slow: end-to-end test that only runs with --run-slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test; use --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="module", autouse=False)
+def shared_session_manager():
+    """Fixture that provides one SessionManager instance per test module."""
+    # Imported lazily so collecting tests that don't use it skips the import
+    from agent.core.session_manager import SessionManager
+
+    manager = SessionManager()
+    yield manager
+    manager.sessions.clear()
+
+
+@pytest.fixture(autouse=False)
+def session_manager(shared_session_manager):
+    """Fixture that provides the module's SessionManager, reset for each test.
+
+    Sessions are cleared and the settings tests are allowed to override
+    (TTL and history length) are restored afterwards, so tests stay isolated.
+    """
+    session_ttl = shared_session_manager.session_ttl
+    max_history_length = shared_session_manager.max_history_length
+    yield shared_session_manager
+    shared_session_manager.sessions.clear()
+    shared_session_manager.session_ttl = session_ttl
+    shared_session_manager.max_history_length = max_history_length
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert frozen data back to plain, mutable dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Sample session data shared by all tests. It is read-only: tests that need
+# to modify it must work on a copy (see _thaw).
+SAMPLE_SESSION_DATA: Mapping[str, Any] = _freeze({
+    "conversation_history": [
+        {
+            "timestamp": 1650000000.0,
+            "user_input": "What does CARC code 16 mean?",
+            "agent_response": "CARC code 16 indicates 'Claim/service lacks information or has submission/billing error(s).'",
+            "metadata": {
+                "task_type": "denial_classification",
+                "intent": "code_explanation"
             }
-        ],
-        "claim_details": {
-            "patient_name": "SAMPLE PATIENT",
-            "claim_number": "SAMPLE123",
-            "date_of_service": "2025-01-15",
-        },
-        "denial_codes": ["16", "N479"],
-        "documents": [
-            {
-                "document_id": "doc-sample1",
-                "document_type": "cms1500",
-                "added_timestamp": 1650000000.0,
-                "metadata": {
-                    "filename": "sample_cms1500.pdf",
-                    "content_type": "application/pdf",
-                    "page_count": 1
-                }
+        }
+    ],
+    "claim_details": {
+        "patient_name": "SAMPLE PATIENT",
+        "claim_number": "SAMPLE123",
+        "date_of_service": "2025-01-15",
+    },
+    "denial_codes": ["16", "N479"],
+    "documents": [
+        {
+            "document_id": "doc-sample1",
+            "document_type": "cms1500",
+            "added_timestamp": 1650000000.0,
+            "metadata": {
+                "filename": "sample_cms1500.pdf",
+                "content_type": "application/pdf",
+                "page_count": 1
             }
-        ],
-        "conversation_state": "analyzing_denial",
-        "remediation_provided": False,
-        "documents_processing": False,
-        "created_at": 1650000000.0,
-        "last_active": 1650000100.0
-    }
+        }
+    ],
+    "conversation_state": "analyzing_denial",
+    "remediation_provided": False,
+    "documents_processing": False,
+    "created_at": 1650000000.0,
+    "last_active": 1650000100.0
+})
+
+
+@pytest.fixture(scope="session", autouse=False)
+def sample_session_data() -> Mapping[str, Any]:
+    """Fixture that provides read-only sample session data for testing."""
+    return SAMPLE_SESSION_DATA
 
 
-@pytest.fixture
+@pytest.fixture(autouse=False)
 def sample_session(session_manager, sample_session_data):
     """Fixture that provides a sample session in the session manager."""
     session_id = session_manager.create_session()
-    session_manager.update_session(session_id, sample_session_data)
+    # The session manager gets its own mutable copy of the shared sample data
+    session_manager.update_session(session_id, _thaw(sample_session_data))
     return session_id
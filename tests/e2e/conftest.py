@@ -0,0 +1,161 @@
+"""
+Pytest Configuration for End-to-End Tests
+
+The agent stack is expensive to build, so components are created once per
+test session and shared by every end-to-end test. Each test still gets its
+own session ID, and the artifacts stored under it are removed afterwards.
+
+The tests are independent, so they can run in parallel with pytest-xdist
+(``pytest -n auto``). Session-scoped fixtures are then built once per worker.
+
+The tests are marked slow and only run with ``--run-slow``.
+"""
+
+import os
+import contextlib
+import pytest
+from pathlib import Path
+from typing import Dict
+
+from agent.core.session_manager import SessionManager
+from agent.core.coordinator import CoordinatorAgent
+from agent.core.sequential_agent import SequentialAgent
+from agent.classifiers.denial_classifier import DenialClassifierAgent
+from agent.analyzers.claims_analyzer import ClaimsAnalyzerAgent
+from agent.advisors.remediation_advisor import RemediationAdvisorAgent
+from agent.tools.document_processing.artifact_manager import ArtifactManager
+
+
+# Example documents used by the end-to-end tests
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(__file__),
+    '../../Project Documentation/Denials_Example'
+)
+
+
+@pytest.fixture(scope="session")
+def test_documents() -> Dict[str, str]:
+    """Fixture that provides paths to the example CMS-1500 and EOB documents."""
+    documents = {
+        "cms1500": os.path.join(EXAMPLES_DIR, 'CMS-1500/Print-Claim-748155-060420241000.pdf'),
+        "eob": os.path.join(EXAMPLES_DIR, 'ERN.pdf')
+    }
+
+    # Skip tests if documents don't exist
+    if not all(os.path.exists(path) for path in documents.values()):
+        pytest.skip("Test documents not found")
+
+    return documents
+
+
+@pytest.fixture(scope="session")
+def cms1500_bytes(test_documents) -> bytes:
+    """Fixture that provides the example CMS-1500 document, read once per session."""
+    return Path(test_documents["cms1500"]).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def eob_bytes(test_documents) -> bytes:
+    """Fixture that provides the example EOB document, read once per session."""
+    return Path(test_documents["eob"]).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def session_manager():
+    """Fixture that provides a SessionManager shared by all end-to-end tests."""
+    return SessionManager()
+
+
+@pytest.fixture(scope="session")
+def artifact_manager(tmp_path_factory):
+    """Fixture that provides a shared ArtifactManager instance.
+
+    Artifacts are stored in a temporary directory, which pytest-xdist makes
+    unique per worker, so parallel workers never share the metadata file.
+    """
+    return ArtifactManager(artifact_dir=str(tmp_path_factory.mktemp("artifacts")))
+
+
+@pytest.fixture(scope="session")
+def cms1500_parser():
+    """Fixture that provides a shared CMS1500Parser instance."""
+    # Parsers and the PHI detector are imported on first use, so only the
+    # tests that request them pay for loading their pattern tables
+    from agent.tools.document_processing.cms1500_parser import CMS1500Parser
+
+    return CMS1500Parser()
+
+
+@pytest.fixture(scope="session")
+def eob_parser():
+    """Fixture that provides a shared EOBParser instance."""
+    from agent.tools.document_processing.eob_parser import EOBParser
+
+    return EOBParser()
+
+
+@pytest.fixture(scope="session")
+def phi_detector():
+    """Fixture that provides a shared PHIDetector instance."""
+    from agent.security.phi_detector import PHIDetector
+
+    return PHIDetector()
+
+
+@pytest.fixture(scope="session")
+def parsed_cms1500(cms1500_parser, cms1500_bytes):
+    """Fixture that provides the example CMS-1500 document, parsed once per session."""
+    return cms1500_parser.parse(document_data=cms1500_bytes)
+
+
+@pytest.fixture(scope="session")
+def parsed_eob(eob_parser, eob_bytes):
+    """Fixture that provides the example EOB document, parsed once per session."""
+    return eob_parser.parse(document_data=eob_bytes)
+
+
+@pytest.fixture(scope="session")
+def specialized_agents():
+    """Fixture that provides the specialized agents, keyed by registration name."""
+    return {
+        "denial_classifier": DenialClassifierAgent(),
+        "claims_analyzer": ClaimsAnalyzerAgent(),
+        "remediation_advisor": RemediationAdvisorAgent()
+    }
+
+
+@pytest.fixture(scope="session")
+def coordinator_agent(specialized_agents):
+    """Fixture that provides a coordinator with all specialized agents registered."""
+    coordinator = CoordinatorAgent()
+    for name, agent in specialized_agents.items():
+        coordinator.register_specialized_agent(name, agent)
+    return coordinator
+
+
+@pytest.fixture(scope="session")
+def sequential_agent(specialized_agents):
+    """Fixture that provides a sequential agent with all specialized agents registered."""
+    agent = SequentialAgent()
+    for name, specialized_agent in specialized_agents.items():
+        agent.register_specialized_agent(name, specialized_agent)
+    return agent
+
+
+@pytest.fixture
+def session_id(session_manager, artifact_manager):
+    """Fixture that provides a fresh session and cleans up after the test.
+
+    pytest sets up the session-scoped test_documents fixture first, so a test
+    skipped for missing documents never creates a session to clean up.
+    """
+    session_id = session_manager.create_session()
+    yield session_id
+
+    # Clean up artifacts associated with the session; an artifact the test
+    # already removed must not turn cleanup into an error
+    with contextlib.suppress(KeyError):
+        artifacts = artifact_manager.get_artifacts_by_session(session_id)
+        artifact_manager.delete_artifacts([artifact["artifact_id"] for artifact in artifacts])
+
+    session_manager.delete_session(session_id)
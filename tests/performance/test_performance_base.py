@@ -1,14 +1,24 @@
 """Base class and utilities for performance testing the Medical Billing Denial Agent."""
 
 import time
+import timeit
 import statistics
+import sys
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
 from typing import List, Dict, Any, Callable, Optional, Type
 import json
 import os
 import datetime
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
 class PerformanceTestBase(unittest.TestCase):
     """Base class for all performance tests.
     
@@ -30,13 +40,12 @@ class PerformanceTestBase(unittest.TestCase):
     def setUp(self):
         """Set up the performance test environment."""
         self.results = []
-        self.test_start_time = time.time()
+        self._test_start_ns = time.perf_counter_ns()
         self.baseline_data = self._load_baseline_data()
         
     def tearDown(self):
         """Clean up after test execution and record results."""
-        self.test_end_time = time.time()
-        self.test_duration = self.test_end_time - self.test_start_time
+        self.test_duration = (time.perf_counter_ns() - self._test_start_ns) / 1e9
         
         # Save results if any were collected
         if self.results:
@@ -142,13 +151,71 @@ class PerformanceTestBase(unittest.TestCase):
         Returns:
             Execution time in seconds
         """
-        start_time = time.time()
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = (time.perf_counter_ns() - start) / 1e9
         
         return execution_time, result
     
+    def parallel_parse(self, parse_func: Callable, docs: List[str], workers: int = 4,
+                       max_inflight: int = 16, **parse_kwargs) -> List[Any]:
+        """Parse documents on a thread pool, bounding the documents in flight.
+        
+        Suited to parsing dominated by I/O or OCR subprocesses, which release
+        the GIL. A document is only submitted once fewer than max_inflight
+        are being parsed or waiting, which caps memory on large batches.
+        
+        Args:
+            parse_func: Function that parses one document path
+            docs: Paths of the documents to parse
+            workers: Number of worker threads
+            max_inflight: Maximum number of documents submitted but not done
+            **parse_kwargs: Extra keyword arguments for parse_func
+            
+        Returns:
+            Parse results, in the same order as docs
+        """
+        slots = threading.Semaphore(max_inflight)
+        futures = []
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for doc in docs:
+                slots.acquire()
+                future = executor.submit(parse_func, doc, **parse_kwargs)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+        
+        return [future.result() for future in futures]
+    
+    def record_peak_memory(self, category: str, test_case: str) -> Optional[Dict[str, Any]]:
+        """Record the process's peak resident set size as a peak_rss_mb metric.
+        
+        The value is the high-water mark of the whole test process since it
+        started, not of a single test, and excludes worker processes. It is
+        recorded for trend tracking only, without a pass/fail threshold.
+        
+        Args:
+            category: Test category
+            test_case: Specific test case identifier
+            
+        Returns:
+            Result dictionary from record_metric, or None if the platform
+            doesn't report peak RSS
+        """
+        if resource is None:
+            return None
+        
+        # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss_mb = peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+        
+        return self.record_metric(
+            metric="peak_rss_mb",
+            value=peak_rss_mb,
+            category=category,
+            test_case=test_case
+        )
+    
     def record_metric(self, metric: str, value: float, category: str, 
                      test_case: str, threshold: Optional[float] = None):
         """Record a performance metric.
@@ -205,15 +272,87 @@ class PerformanceTestBase(unittest.TestCase):
                       f"value={result['value']}, threshold={result['threshold']}")
                 
         self.assertTrue(result["passed"], message)
+    
+    def record_response_time(self, execution_time: float, category: str,
+                             test_case: str, threshold: Optional[float] = None,
+                             cpu_time: Optional[float] = None):
+        """Record a response time and assert that it meets its threshold.
+        
+        Args:
+            execution_time: Measured execution time in seconds
+            category: Test category
+            test_case: Specific test case identifier
+            threshold: Optional threshold; defaults to one based on the category
+            cpu_time: Optional CPU time of the process over the same interval,
+                in seconds; recorded as a cpu_time metric so I/O waits can
+                be told apart from compute
+            
+        Returns:
+            Result dictionary from record_metric
+        """
+        if cpu_time is not None:
+            self.record_metric(
+                metric="cpu_time",
+                value=cpu_time,
+                category=category,
+                test_case=test_case
+            )
+        
+        # Use the provided threshold or a default based on category
+        if threshold is None:
+            if category == self.CATEGORY_DOCUMENT_PROCESSING:
+                threshold = self.DEFAULT_RESPONSE_TIME_THRESHOLD * 2
+            else:
+                threshold = self.DEFAULT_RESPONSE_TIME_THRESHOLD
+        
+        # Record the performance metric
+        result = self.record_metric(
+            metric="response_time",
+            value=execution_time,
+            category=category,
+            test_case=test_case,
+            threshold=threshold
+        )
+        
+        # Assert that performance meets the threshold
+        self.assert_performance_metric(result)
+        
+        return result
+    
+    @contextmanager
+    def measure_performance(self, category: str, test_case: str,
+                            threshold: Optional[float] = None):
+        """Context manager that times its block as one response time measurement.
+        
+        Lets a single test method measure several test cases, e.g. one per
+        subTest. Nothing is recorded if the block raises.
+        
+        Args:
+            category: Test category
+            test_case: Specific test case identifier
+            threshold: Optional threshold value for pass/fail determination
+        """
+        start = time.perf_counter_ns()
+        cpu_start = time.process_time_ns()
+        yield
+        execution_time = (time.perf_counter_ns() - start) / 1e9
+        cpu_time = (time.process_time_ns() - cpu_start) / 1e9
+        
+        self.record_response_time(execution_time, category, test_case, threshold, cpu_time)
 
 
-def performance_test(category: str, test_case: str, threshold: Optional[float] = None):
+def performance_test(category: str, test_case: str, threshold: Optional[float] = None,
+                     autorange: bool = False):
     """Decorator for measuring function performance.
     
     Args:
         category: Test category
         test_case: Specific test case identifier
         threshold: Optional threshold value for pass/fail determination
+        autorange: Whether to repeat the test body with timeit.Timer.autorange
+            (until at least 0.2 seconds have elapsed) and record the mean time
+            per call, instead of timing a single call. Only suitable for fast
+            test bodies without lasting side effects.
         
     Returns:
         Decorated function
@@ -225,32 +364,29 @@ def performance_test(category: str, test_case: str, threshold: Optional[float] =
                 raise TypeError("Performance test decorator can only be used on "
                               "methods of PerformanceTestBase subclasses")
                 
-            start_time = time.time()
-            result = func(self, *args, **kwargs)
-            end_time = time.time()
-            execution_time = end_time - start_time
-            
-            # Use the provided threshold or a default based on category
-            actual_threshold = threshold
-            if actual_threshold is None:
-                if category == PerformanceTestBase.CATEGORY_AGENT_RESPONSE:
-                    actual_threshold = self.DEFAULT_RESPONSE_TIME_THRESHOLD
-                elif category == PerformanceTestBase.CATEGORY_DOCUMENT_PROCESSING:
-                    actual_threshold = self.DEFAULT_RESPONSE_TIME_THRESHOLD * 2
-                else:
-                    actual_threshold = self.DEFAULT_RESPONSE_TIME_THRESHOLD
-            
-            # Record the performance metric
-            perf_result = self.record_metric(
-                metric="response_time",
-                value=execution_time,
-                category=category,
-                test_case=test_case,
-                threshold=actual_threshold
-            )
+            if autorange:
+                last_result = []
+                
+                def run_once():
+                    last_result[:] = [func(self, *args, **kwargs)]
+                
+                # Mark CPU time after each autorange trial; only the final
+                # trial's number and time are reported
+                cpu_marks = [time.process_time_ns()]
+                number, total_time = timeit.Timer(run_once).autorange(
+                    lambda number, time_taken: cpu_marks.append(time.process_time_ns())
+                )
+                cpu_time = (cpu_marks[-1] - cpu_marks[-2]) / 1e9 / number
+                result = last_result[0]
+                execution_time = total_time / number
+            else:
+                start = time.perf_counter_ns()
+                cpu_start = time.process_time_ns()
+                result = func(self, *args, **kwargs)
+                execution_time = (time.perf_counter_ns() - start) / 1e9
+                cpu_time = (time.process_time_ns() - cpu_start) / 1e9
             
-            # Assert that performance meets the threshold
-            self.assert_performance_metric(perf_result)
+            self.record_response_time(execution_time, category, test_case, threshold, cpu_time)
             
             return result
         return wrapper
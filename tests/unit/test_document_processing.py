@@ -6,6 +6,7 @@ including the CMS-1500 parser, EOB parser, and artifact management system.
 """
 
 import base64
+import mmap
 import os
 import tempfile
 import unittest
@@ -68,6 +69,25 @@ class TestArtifactManager(unittest.TestCase):
         with open(artifact_path, 'rb') as f:
             self.assertEqual(f.read(), test_data)
     
+    def test_store_artifact_from_buffer(self):
+        """Test storing an artifact from a memory-mapped file without a copy."""
+        test_data = b"Test document data"
+        source_path = os.path.join(self.temp_dir, "source.pdf")
+        with open(source_path, 'wb') as f:
+            f.write(test_data)
+        
+        with open(source_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            artifact_id = self.artifact_manager.store_artifact(
+                document_data=memoryview(mm),
+                filename="source.pdf",
+                content_type="application/pdf"
+            )
+        
+        # Check the stored size and content
+        metadata = self.artifact_manager.get_artifact_metadata(artifact_id)
+        self.assertEqual(metadata["size_bytes"], len(test_data))
+        self.assertEqual(self.artifact_manager.get_artifact(artifact_id), test_data)
+    
     def test_get_artifact(self):
         """Test retrieving an artifact."""
         test_data = b"Test document data"
@@ -106,6 +126,31 @@ class TestArtifactManager(unittest.TestCase):
         result = self.artifact_manager.delete_artifact("non-existent")
         self.assertFalse(result)
     
+    def test_delete_artifacts(self):
+        """Test deleting several artifacts at once."""
+        artifact_ids = [
+            self.artifact_manager.store_artifact(
+                document_data=b"Test document data",
+                filename=f"test{i}.pdf",
+                content_type="application/pdf"
+            )
+            for i in range(3)
+        ]
+        
+        # Delete two artifacts plus one unknown ID
+        with patch.object(self.artifact_manager, "_save_metadata") as mock_save:
+            deleted = self.artifact_manager.delete_artifacts(artifact_ids[:2] + ["non-existent"])
+        
+        # Metadata is written once for the whole batch
+        self.assertEqual(deleted, 2)
+        mock_save.assert_called_once()
+        
+        # Check that only the requested artifacts are gone
+        for artifact_id in artifact_ids[:2]:
+            self.assertNotIn(artifact_id, self.artifact_manager.artifacts_metadata)
+            self.assertFalse(os.path.exists(os.path.join(self.temp_dir, artifact_id)))
+        self.assertIn(artifact_ids[2], self.artifact_manager.artifacts_metadata)
+    
     def test_get_artifacts_by_session(self):
         """Test retrieving artifacts by session ID."""
         # Create test artifacts with different session IDs
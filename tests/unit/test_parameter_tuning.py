@@ -0,0 +1,74 @@
+"""
+Tests for the parameter tuning framework.
+
+This module contains tests for how the ParameterTuner selects and reports
+evaluated configurations.
+"""
+
+import pytest
+
+from optimization.parameter_tuning import ModelConfiguration, ParameterTuner
+
+
+class TestParameterTuner:
+    """Tests for the ParameterTuner class."""
+    
+    @pytest.fixture
+    def tuner(self, tmp_path):
+        """Create a tuner writing its results to a temporary directory."""
+        return ParameterTuner(
+            base_configuration=ModelConfiguration(config_id="base"),
+            parameter_definitions={},
+            evaluation_scenarios_dir=str(tmp_path / "scenarios"),
+            results_dir=str(tmp_path / "results")
+        )
+    
+    @staticmethod
+    def _add_configuration(tuner, config_id, score, metadata=None):
+        """Save an evaluated configuration and return its metrics."""
+        configuration = ModelConfiguration(
+            config_id=config_id,
+            parameters={"temperature": score / 100},
+            metadata=metadata
+        )
+        configuration.evaluation_results = {"overall_score": score}
+        tuner._save_configuration(configuration)
+        return configuration.evaluation_results
+    
+    def test_pruned_configurations_are_not_ranked(self, tuner):
+        """Test that partial metrics of pruned trials never win."""
+        evaluated_configs = {
+            "complete": self._add_configuration(tuner, "complete", 70.0),
+            "pruned": self._add_configuration(
+                tuner, "pruned", 95.0, metadata={"pruned_after_scenarios": 1}
+            ),
+        }
+        
+        best_config_id, best_config = tuner.find_best_configuration(evaluated_configs)
+        assert best_config_id == "complete"
+        assert best_config.config_id == "complete"
+        
+        report = tuner.generate_optimization_report(evaluated_configs)
+        assert report["best_configuration_id"] == "complete"
+        assert [result["config_id"] for result in report["results"]] == ["complete"]
+        assert [result["config_id"] for result in report["pruned_results"]] == ["pruned"]
+        assert report["num_configurations"] == 2
+    
+    def test_all_configurations_pruned(self, tuner):
+        """Test that no best configuration is chosen when every trial was pruned."""
+        evaluated_configs = {
+            "pruned": self._add_configuration(
+                tuner, "pruned", 95.0, metadata={"pruned_after_scenarios": 2}
+            ),
+        }
+        
+        assert tuner.find_best_configuration(evaluated_configs) == (None, None)
+        
+        report = tuner.generate_optimization_report(evaluated_configs)
+        assert report["best_configuration_id"] is None
+        assert report["results"] == []
+    
+    def test_unpicklable_apply_function_is_rejected(self, tuner):
+        """Test that a lambda fails up front instead of once per configuration."""
+        with pytest.raises(TypeError, match="picklable"):
+            tuner.evaluate_configurations([ModelConfiguration()], lambda parameters: None)
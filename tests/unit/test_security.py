@@ -168,6 +168,23 @@ class TestPHIDetector:
         assert len(detections) > 0
         assert any(d.category == "PATIENT_NAME" and d.text == "Jane Doe" for d in detections)
     
+    def test_context_boost_patterns_precompiled(self):
+        """Test that context boost terms are compiled once, not per match."""
+        detector = PHIDetector()
+        
+        # Every pattern carries its compiled context boost terms
+        for pattern_info in detector.phi_patterns.values():
+            compiled = pattern_info["compiled_context_boost"]
+            assert [regex.pattern for regex in compiled] == pattern_info.get("context_boost", [])
+        
+        # Detection uses the compiled terms without going through re.search
+        with patch("agent.security.phi_detector.re.search") as mock_search:
+            detections = detector.detect_phi("Patient name: Jane Doe")
+        
+        mock_search.assert_not_called()
+        name_detection = next(d for d in detections if d.text == "Jane Doe")
+        assert name_detection.confidence == pytest.approx(0.9)
+    
     def test_detect_phi_ssn(self):
         """Test detection of SSNs."""
         detector = PHIDetector()
@@ -7,6 +7,7 @@ it correctly handles session creation, retrieval, and updates.
 
 import time
 import json
+import uuid
 import pytest
 from typing import Dict, Any
 
@@ -38,6 +39,17 @@ def test_session_creation(session_manager):
     assert session["documents_processing"] is False
 
 
+def test_session_ids_unique_across_batches(session_manager):
+    """Test that pre-generated session IDs are unique version 4 UUIDs."""
+    # Create enough sessions to draw from more than one batch of IDs
+    session_ids = [session_manager.create_session() for _ in range(150)]
+    
+    assert len(set(session_ids)) == len(session_ids)
+    for session_id in session_ids:
+        assert uuid.UUID(session_id).version == 4
+        assert str(uuid.UUID(session_id)) == session_id
+
+
 def test_session_creation_with_initial_context(session_manager):
     """Test that sessions can be created with initial context."""
     initial_context = {
@@ -400,6 +412,38 @@ def test_export_import_session(session_manager):
     assert len(imported_session["conversation_history"]) == 1
 
 
+def test_clone_session(session_manager):
+    """Test that sessions can be copied in memory under a new ID."""
+    # Create a session with data
+    original_session_id = session_manager.create_session()
+    session_manager.update_session(original_session_id, {
+        "claim_details": {"claim_id": "12345"}
+    })
+    session_manager.add_conversation_turn(
+        original_session_id,
+        "What's the problem with my claim?",
+        "Your claim was denied due to missing information."
+    )
+    
+    # Clone the session
+    cloned_session_id = session_manager.clone_session(original_session_id)
+    assert cloned_session_id is not None
+    assert cloned_session_id != original_session_id
+    
+    # Verify the clone has the same data
+    cloned_session = session_manager.get_session(cloned_session_id)
+    assert cloned_session["claim_details"]["claim_id"] == "12345"
+    assert len(cloned_session["conversation_history"]) == 1
+    
+    # Verify the clone is independent of the original
+    cloned_session["claim_details"]["claim_id"] = "67890"
+    original_session = session_manager.get_session(original_session_id)
+    assert original_session["claim_details"]["claim_id"] == "12345"
+    
+    # Cloning a nonexistent session fails
+    assert session_manager.clone_session("nonexistent-session") is None
+
+
 def test_cleanup_expired_sessions(session_manager):
     """Test that expired sessions are cleaned up."""
     # Override session_ttl to a very small value for testing